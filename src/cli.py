@@ -1,21 +1,78 @@
 import argparse
+import json
 import logging
 import os
 import sys
+from typing import Optional
 
-from src.clients.github_client import GitHubClient
-from src.clients.youtrack_client import YouTrackClient
-from src.services.service_orchestrator import ServiceOrchestrator
-from src.synchronizers.issue_synchronizer import IssueSynchronizer
-
+# Only lightweight modules are imported here so that `status` starts fast;
+# the clients (requests, dateutil) are imported lazily in `main`.
+from src.state.state_store import StateStore
+from src.synchronizers.issue_reconciler import RECONCILE_ACTIONS
+from src.synchronizers.request_estimator import estimate_from_state
 
 import src.config as config
-from src.logging_config import configure_logging
 
-configure_logging()
 log = logging.getLogger("gh2yt")
 
 
+def status(state_store: StateStore, as_json: bool = False) -> dict:
+    """
+    Prints the synchronization status from local state only.
+
+    No network access and no client imports are needed, which keeps the
+    command cheap enough for health checks run every few seconds.
+    """
+    meta = state_store.read("meta", {})
+    journal = state_store.read("journal", {})
+    report = {
+        "repo": meta.get("repo"),
+        "last_sync": meta.get("last_sync"),
+        "watermark": meta.get("watermark"),
+        "snapshot_refreshed_at": meta.get("snapshot_refreshed_at"),
+        "mapped_issues": meta.get("mapped_issues", 0),
+        "pending_journal_entries": journal.get("total", 0) - len(journal.get("done", [])),
+        "last_cycle": meta.get("last_cycle"),
+        "freshness_rolling": meta.get("freshness_rolling"),
+    }
+
+    if as_json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key}: {value if value is not None else '-'}")
+    return report
+
+
+def estimate(state_store: StateStore, plan_file: str, issue_count: Optional[int] = None,
+             max_requests: Optional[int] = None, continuous: bool = False, as_json: bool = False) -> dict:
+    """
+    Prints the predicted requests per phase of the next run, from local state only.
+
+    If the plan file exists, the estimate is for applying it; otherwise
+    it is for a sync of the issues seen by the last run (or `issue_count`),
+    one cycle of continuous sync if `continuous` is set.
+    """
+    plan = None
+    if os.path.exists(plan_file):
+        from src.synchronizers.migration_planner import load_plan
+        plan = load_plan(plan_file)
+    report = estimate_from_state(state_store, plan=plan, issue_count=issue_count, continuous=continuous)
+    report["budget"] = {"max_requests": max_requests, "fits": max_requests is None or report["total"]["requests"] <= max_requests}
+
+    if as_json:
+        print(json.dumps(report))
+    else:
+        print(f"estimate for: {'apply ' + plan_file if plan else 'sync'}")
+        for section in ("predicted", "github", "youtrack"):
+            for phase, count in report[section].items():
+                print(f"{section}.{phase}: {count}")
+        print(f"total: {report['total']['requests']}")
+        if max_requests is not None:
+            print(f"budget: {max_requests} ({'fits' if report['budget']['fits'] else 'exceeded'})")
+    return report
+
+
 def main():
     """
     Main entry point for the CLI application.
@@ -25,22 +82,47 @@ def main():
     and synchronizer, and runs either a one-time import or
     continuous synchronization of GitHub issues into YouTrack.
 
+    Commands:
+       import: One-time import or continuous sync (default)
+       plan: Compute the create/update diff and write it to a plan file
+       apply: Execute a previously written plan file
+       reconcile: Detect YouTrack issues deleted/transferred on GitHub
+       status: Print sync status from local state, without network access
+       estimate: Predict the requests of the next run per phase, without network access
+
     CLI Arguments:
-       --repo: GitHub repository in format owner/repo (required)
-       --project: YouTrack project ID or shortName (required)
+       --repo: GitHub repository in format owner/repo (required except for apply)
+       --project: YouTrack project ID or shortName (required except for apply)
        --state: GitHub issue state filter ('open', 'closed', 'all')
        --dry-run: Simulate import without creating/updating issues
        --limit: Limit number of issues (0 = all issues)
        --sync: Enable continuous synchronization mode
        --interval: Interval in seconds between syncs (default=60)
+       --plan-file: Path of the plan file written by plan and read by apply
+       --workers: Number of concurrent writers used by apply
+       --batch-size: Number of plan entries applied between checkpoints
+       --reconcile-action: What to do with issues missing on GitHub (report, tag, close)
+       --json: Print status as JSON
+       --issues: Sync only the given issue numbers/ranges (e.g. 12,40-55)
+       --initial-import: Bulk-create issues into an empty project without existence checks
+       --max-requests: Stop cleanly at the next checkpoint once this many requests were made
+       --issue-count: Number of GitHub issues assumed by estimate
     """
 
     parser = argparse.ArgumentParser(
         description="Import GitHub issues to YouTrack and optionally synchronize them."
     )
 
-    parser.add_argument("--repo", required=True, help="GitHub repo in format owner/repo")
-    parser.add_argument("--project", required=True, help="YouTrack project ID or shortName")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="import",
+        choices=["import", "plan", "apply", "reconcile", "status", "estimate"],
+        help="import (default), plan changes offline, apply a plan file, reconcile missing issues, "
+             "show status, or estimate requests"
+    )
+    parser.add_argument("--repo", help="GitHub repo in format owner/repo")
+    parser.add_argument("--project", help="YouTrack project ID or shortName")
     parser.add_argument(
         "--state",
         default="all",
@@ -51,13 +133,76 @@ def main():
     parser.add_argument("--limit", type=int, default=0, help="Limit number of issues (0 = all)")
     parser.add_argument("--sync", action="store_true", help="Enable continuous synchronization")
     parser.add_argument("--interval", type=int, default=60, help="Sync interval in seconds")
+    parser.add_argument("--plan-file", default="gh2yt-plan.json", help="Plan file written by plan and read by apply")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent YouTrack writers used by apply")
+    parser.add_argument("--batch-size", type=int, default=50, help="Plan entries applied between checkpoints")
+    parser.add_argument(
+        "--reconcile-action",
+        default=config.RECONCILE_ACTION,
+        choices=RECONCILE_ACTIONS,
+        help="Action for YouTrack issues whose GitHub issue disappeared"
+    )
+    parser.add_argument("--json", action="store_true", help="Print status as JSON")
+    parser.add_argument("--issues", help="Only sync these GitHub issue numbers/ranges, e.g. 12,40-55")
+    parser.add_argument(
+        "--initial-import",
+        action="store_true",
+        help="Bulk-create all issues without checking YouTrack first (empty projects only)"
+    )
+
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=config.MAX_REQUESTS,
+        help="Per-run cap on GitHub + YouTrack requests; the run stops cleanly at the next checkpoint"
+    )
+    parser.add_argument("--issue-count", type=int, help="Number of GitHub issues assumed by estimate")
 
     args = parser.parse_args()
 
+    state_store = StateStore(config.STATE_DIR)
+
+    if args.command == "status":
+        status(state_store, as_json=args.json)
+        return
+
+    if args.command == "estimate":
+        estimate(
+            state_store, args.plan_file, issue_count=args.issue_count, max_requests=args.max_requests,
+            continuous=args.sync, as_json=args.json
+        )
+        return
+
+    from src.clients.github_client import GitHubClient
+    from src.clients.request_budget import RequestBudget, RequestBudgetExceeded
+    from src.clients.youtrack_client import YouTrackClient
+    from src.logging_config import configure_logging
+    from src.services.service_orchestrator import ServiceOrchestrator
+    from src.synchronizers.freshness_tracker import FreshnessTracker
+    from src.synchronizers.issue_reconciler import IssueReconciler
+    from src.synchronizers.issue_synchronizer import IssueSynchronizer, parse_issue_numbers
+    from src.synchronizers.migration_planner import MigrationPlanner, load_plan, save_plan
+    from src.synchronizers.tier_scheduler import TierScheduler
+
+    configure_logging(
+        level=logging.getLevelName(config.LOG_LEVEL),
+        fmt=config.LOG_FORMAT,
+        issue_sample_rate=config.LOG_ISSUE_SAMPLE_RATE,
+        queue_max_size=config.LOG_QUEUE_MAX_SIZE
+    )
+
+    plan = None
+    if args.command == "apply":
+        plan = load_plan(args.plan_file)
+        args.project = args.project or plan["project"]
+    elif not args.repo or not args.project:
+        parser.error(f"--repo and --project are required for the {args.command} command")
+
     log.info("CLI arguments: %s", args)
 
 
     github_token = config.GITHUB_TOKEN or os.getenv("GITHUB_TOKEN")
+    github_tokens = config.GITHUB_TOKENS or [t for t in os.getenv("GITHUB_TOKENS", "").split(",") if t]
     youtrack_token = config.YOUTRACK_TOKEN or os.getenv("YOUTRACK_TOKEN")
 
     if not youtrack_token:
@@ -65,53 +210,132 @@ def main():
         sys.exit(1)
 
     log.info("GitHub token: %s", github_token[:5] + "..." if github_token else "None")
+    if github_tokens:
+        log.info("GitHub token pool: %d tokens", len(github_tokens))
     log.info("YouTrack URL: %s", config.YOUTRACK_URL)
     log.info("YouTrack Project ID: %s", config.YOUTRACK_PROJECT_ID)
 
+    budget = RequestBudget(args.max_requests)
+    if args.max_requests is not None:
+        predicted = estimate_from_state(state_store, plan=plan, continuous=args.sync)["total"]["requests"]
+        log.info("Request budget: %d requests (estimated need: %d)", args.max_requests, predicted)
+        if predicted > args.max_requests:
+            log.warning("Estimated requests exceed the budget; the run will stop early and can be resumed")
 
-    gh = GitHubClient(token=github_token)
-    yt = YouTrackClient(base_url=config.YOUTRACK_URL, token=youtrack_token)
-
+    gh = GitHubClient(
+        token=github_token,
+        tokens=github_tokens,
+        max_workers=config.GITHUB_PAGE_WORKERS,
+        rate_limit_reserve=config.GITHUB_RATE_LIMIT_RESERVE,
+        budget=budget
+    )
+    yt = YouTrackClient(base_url=config.YOUTRACK_URL, token=youtrack_token, budget=budget)
 
     orchestrator = ServiceOrchestrator(
         yt_client=yt,
         project_short=args.project,
-        project_id=config.YOUTRACK_PROJECT_ID
+        project_id=plan["project_id"] if plan else config.YOUTRACK_PROJECT_ID,
+        state_store=state_store,
+        version_field=config.VERSION_FIELD,
+        cache_max_entries=config.CACHE_MAX_ENTRIES
     )
 
+    # Every command stops cleanly once the request budget is used up; progress is already saved
+    try:
+        if args.command == "plan":
+            planner = MigrationPlanner(gh, orchestrator, state_store, budget=budget)
+            plan = planner.plan(repo=args.repo, state=args.state, limit=args.limit if args.limit > 0 else None)
+            save_plan(plan, args.plan_file)
+            log.info("Plan written to %s: %s", args.plan_file, plan["summary"])
+            return
 
-    syncer = IssueSynchronizer(gh_client=gh, service_orchestrator=orchestrator)
+        if args.command == "apply":
+            planner = MigrationPlanner(gh, orchestrator, state_store, budget=budget)
+            planner.apply(plan, workers=args.workers, batch_size=args.batch_size)
+            return
 
-    if args.sync:
-        log.info("Starting synchronization mode (continuous)...")
-        syncer.sync(
-            repo=args.repo,
-            state=args.state,
-            interval=args.interval,
-            once=False,
-            dry_run=args.dry_run,
-            limit=args.limit if args.limit > 0 else None,
+        reconciler = IssueReconciler(
+            gh,
+            orchestrator,
+            state_store,
+            action=args.reconcile_action,
+            tag=config.RECONCILE_TAG,
+            interval=config.RECONCILE_INTERVAL
         )
-    else:
-        log.info("Starting one-time import (sync once)...")
-        syncer.sync(
-            repo=args.repo,
-            state=args.state,
-            once=True,
-            dry_run=args.dry_run,
-            limit=args.limit if args.limit > 0 else None,
+
+        if args.command == "reconcile":
+            orchestrator.refresh_snapshot()
+            orchestrator.save_snapshot()
+            reconciler.reconcile(args.repo)
+            return
+
+        syncer = IssueSynchronizer(
+            gh_client=gh,
+            service_orchestrator=orchestrator,
+            state_store=state_store,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            budget=budget,
+            freshness=FreshnessTracker(
+                slo_seconds=config.FRESHNESS_SLO_SECONDS,
+                slo_percentile=config.FRESHNESS_SLO_PERCENTILE,
+                window_size=config.FRESHNESS_WINDOW_SAMPLES,
+                state_store=state_store
+            ),
+            reconciler=reconciler,
+            scheduler=TierScheduler(
+                hot_age=config.TIER_HOT_AGE,
+                warm_age=config.TIER_WARM_AGE,
+                warm_interval=config.TIER_WARM_INTERVAL,
+                cold_interval=config.TIER_COLD_INTERVAL,
+                state_store=state_store
+            )
         )
 
+        if args.issues:
+            try:
+                numbers = parse_issue_numbers(args.issues)
+            except ValueError as e:
+                parser.error(f"Invalid --issues value: {e}")
+            log.info("Starting targeted sync of %d issues...", len(numbers))
+            syncer.sync_numbers(repo=args.repo, numbers=numbers)
+            return
+
+        if args.sync:
+            log.info("Starting synchronization mode (continuous)...")
+            syncer.sync(
+                repo=args.repo,
+                state=args.state,
+                interval=args.interval,
+                once=False,
+                dry_run=args.dry_run,
+                limit=args.limit if args.limit > 0 else None,
+                initial_import=args.initial_import,
+            )
+        else:
+            log.info("Starting one-time import (sync once)...")
+            syncer.sync(
+                repo=args.repo,
+                state=args.state,
+                once=True,
+                dry_run=args.dry_run,
+                limit=args.limit if args.limit > 0 else None,
+                initial_import=args.initial_import,
+            )
+    except RequestBudgetExceeded as e:
+        log.warning("%s, stopped early (%d requests used); re-run to continue", e, budget.used)
+
 
 if __name__ == "__main__":
-    # Example invocation for testing/debugging
-    sys.argv = [
-        "cli.py",
-        "--repo", "devlastu/ImportFromClickUpToYouTrack",
-        "--project", "GS",
-        "--sync",
-        "--interval", "10",
-        # "--limit", "1"
-    ]
+    # Example invocation for testing/debugging when no arguments are given
+    if len(sys.argv) == 1:
+        sys.argv = [
+            "cli.py",
+            "--repo", "devlastu/ImportFromClickUpToYouTrack",
+            "--project", "GS",
+            "--sync",
+            "--interval", "10",
+            # "--limit", "1"
+        ]
     main()
 
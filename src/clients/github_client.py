@@ -1,6 +1,12 @@
-import requests, time, logging
+import requests, logging, re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter, Retry
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.clients.request_budget import RequestBudget, RequestBudgetExceeded
+from src.clients.token_pool import TokenPool
 
 log = logging.getLogger("gh2yt")
 
@@ -10,29 +16,151 @@ def make_session():
     s.mount("https://", HTTPAdapter(max_retries=retries))
     return s
 
+# Issue fields used by the mappers and synchronizer; everything else is dropped
+# right after fetching so that a cycle's issue list stays small.
+ISSUE_KEYS = (
+    "number", "title", "body", "state", "html_url", "repository_url",
+    "created_at", "updated_at", "assignee", "labels", "milestone",
+)
+
+
+def trim_issue(issue: Dict) -> Dict:
+    """Keeps only the fields of a GitHub issue that the sync needs."""
+    trimmed = {key: issue.get(key) for key in ISSUE_KEYS}
+    if trimmed["assignee"]:
+        trimmed["assignee"] = {"login": issue["assignee"].get("login"), "name": issue["assignee"].get("name")}
+    trimmed["labels"] = [{"name": label.get("name")} for label in issue.get("labels") or []]
+    if trimmed["milestone"]:
+        trimmed["milestone"] = {"title": issue["milestone"].get("title")}
+    return trimmed
+
+
+def _take(iterator: Iterator, count: int) -> list:
+    return [item for _, item in zip(range(count), iterator)]
+
+
+def last_page(link_header: str) -> int:
+    """Returns the page number of the rel="last" link of a Link header (1 if absent)."""
+    match = re.search(r'<([^>]+)>;\s*rel="last"', link_header or "")
+    if not match:
+        return 1
+    return int(parse_qs(urlparse(match.group(1)).query).get("page", ["1"])[0])
+
+
 class GitHubClient:
-    def __init__(self, token: Optional[str] = None, session: Optional[requests.Session] = None):
+    def __init__(self, token: Optional[str] = None, session: Optional[requests.Session] = None,
+                 max_workers: int = 4, rate_limit_reserve: int = 10, tokens: Optional[List[str]] = None,
+                 budget: Optional[RequestBudget] = None):
         self.session = session or make_session()
+        self.budget = budget or RequestBudget()
         self.token = token
+        self.max_workers = max_workers
+        # Requests rotate over all tokens; a single token is a pool of one
+        self.token_pool = TokenPool(tokens or [token], reserve=rate_limit_reserve)
 
-    def fetch_issues(self, repo: str, state: str = "all") -> List[Dict]:
-        """Fetches issues from a GitHub repository."""
+    @staticmethod
+    def _headers(token: Optional[str]) -> Dict:
         headers = {"Accept": "application/vnd.github+json"}
-        if self.token:
-            headers["Authorization"] = f"token {self.token}"
+        if token:
+            headers["Authorization"] = f"token {token}"
+        return headers
+
+    def _get(self, url: str) -> requests.Response:
+        """
+        GET using the pooled token with the most remaining budget.
+        A rate-limited response is retried with the next token; once every
+        token is exhausted, `acquire` waits for the earliest reset.
+        """
+        while True:
+            token = self.token_pool.acquire()
+            self.budget.spend()
+            resp = self.session.get(url, headers=self._headers(token), timeout=30)
+            self.token_pool.update(token, resp.headers)
+            if resp.status_code not in (403, 429) or not self.token_pool.exhausted(token):
+                return resp
+            log.warning("GitHub token %s is rate limited, rotating", token[:5] + "..." if token else None)
+
+    def fetch_issue(self, repo: str, number: int) -> Optional[Dict]:
+        """
+        Fetches a single issue by number.
+        Returns None if the issue was deleted or is not visible (404/410).
+        Redirects of transferred issues are followed.
+        """
+        url = f"https://api.github.com/repos/{repo}/issues/{number}"
+        resp = self._get(url)
+        if resp.status_code in (404, 410):
+            return None
+        resp.raise_for_status()
+        return resp.json()
+
+    def fetch_issues_by_number(self, repo: str, numbers: List[int]) -> Tuple[List[Dict], List[int]]:
+        """
+        Fetches specific issues concurrently, in the order of `numbers`.
+
+        Missing issues and pull requests are skipped, and so are transferred
+        issues: GitHub redirects them to an issue of another repository,
+        whose content must not be synced under the requested number.
+        A failed request only fails its own number.
+
+        Returns:
+            Tuple[List[Dict], List[int]]: The fetched issues and the numbers whose request failed.
+        """
+        failed = []
+
+        def fetch(number: int) -> Optional[Dict]:
+            try:
+                return self.fetch_issue(repo, number)
+            except RequestBudgetExceeded:
+                raise
+            except Exception as e:
+                log.error("Error fetching GH #%s: %s", number, e)
+                failed.append(number)
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            fetched = list(pool.map(fetch, numbers))
 
-        url = f"https://api.github.com/repos/{repo}/issues?state={state}&per_page=100"
         issues = []
-        while url:
-            resp = self.session.get(url, headers=headers, timeout=30)
+        for number, issue in zip(numbers, fetched):
+            if not issue or "pull_request" in issue:
+                continue
+            if issue.get("number") != number or not (issue.get("repository_url") or "").endswith(f"/repos/{repo}"):
+                log.warning("GH #%s was transferred to %s, skipping", number, issue.get("html_url"))
+                continue
+            issues.append(trim_issue(issue))
+        return issues, sorted(failed)
+
+    def iter_issue_pages(self, repo: str, state: str = "all") -> Iterator[List[Dict]]:
+        """
+        Yields pages of issues (pull requests excluded) in page order.
+
+        The first response's `rel="last"` link gives the page count; the
+        remaining pages are fetched concurrently by at most `max_workers`
+        threads, with only a bounded number of pages buffered ahead.
+        """
+        base_url = f"https://api.github.com/repos/{repo}/issues?state={state}&per_page=100"
+
+        def fetch_page(page: int) -> List[Dict]:
+            resp = self._get(f"{base_url}&page={page}")
             resp.raise_for_status()
-            page_items = resp.json()
-            issues.extend([it for it in page_items if "pull_request" not in it])
-            url = None
-            link = resp.headers.get("Link", "")
-            if 'rel="next"' in link:
-                for p in link.split(","):
-                    if 'rel="next"' in p:
-                        url = p.split(";")[0].strip("<> ")
-            time.sleep(0.1)
+            return [trim_issue(it) for it in resp.json() if "pull_request" not in it]
+
+        resp = self._get(base_url)
+        resp.raise_for_status()
+        yield [trim_issue(it) for it in resp.json() if "pull_request" not in it]
+
+        pages = iter(range(2, last_page(resp.headers.get("Link", "")) + 1))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            window = deque(pool.submit(fetch_page, page) for page in _take(pages, self.max_workers * 2))
+            while window:
+                items = window.popleft().result()
+                for page in _take(pages, 1):
+                    window.append(pool.submit(fetch_page, page))
+                yield items
+
+    def fetch_issues(self, repo: str, state: str = "all") -> List[Dict]:
+        """Fetches issues from a GitHub repository."""
+        issues = []
+        for page in self.iter_issue_pages(repo, state=state):
+            issues.extend(page)
         return issues
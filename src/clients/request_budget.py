@@ -0,0 +1,44 @@
+import threading
+from typing import Optional
+
+
+class RequestBudgetExceeded(Exception):
+    """Raised by a client when a request would exceed the run's request budget."""
+
+
+class RequestBudget:
+    """
+    Per-run cap on the number of API requests, shared by all clients.
+
+    Clients call `spend` before every request and get RequestBudgetExceeded
+    once the cap is reached. Callers check `can_afford` at their checkpoints
+    (before an issue, before a batch) so that a run stops cleanly between
+    units of work rather than in the middle of one.
+
+    Attributes:
+        max_requests (Optional[int]): Request cap for the run (None = unlimited).
+        used (int): Requests made so far.
+    """
+
+    def __init__(self, max_requests: Optional[int] = None):
+        self.max_requests = max_requests
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def spend(self, count: int = 1) -> None:
+        """Accounts for `count` requests, raising if that would exceed the cap."""
+        with self._lock:
+            if self.max_requests is not None and self.used + count > self.max_requests:
+                raise RequestBudgetExceeded(f"Request budget of {self.max_requests} requests reached")
+            self.used += count
+
+    def remaining(self) -> Optional[int]:
+        """Requests left in the budget (None = unlimited)."""
+        if self.max_requests is None:
+            return None
+        return max(self.max_requests - self.used, 0)
+
+    def can_afford(self, count: int) -> bool:
+        """Returns True if `count` more requests fit into the budget."""
+        remaining = self.remaining()
+        return remaining is None or remaining >= count
@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Mapping, Optional
+
+log = logging.getLogger("gh2yt")
+
+
+class TokenPool:
+    """
+    Pool of GitHub tokens that spreads requests over their rate limits.
+
+    Each token's remaining budget and reset time are tracked from the
+    `X-RateLimit-*` response headers. Every request goes to the token with
+    the most remaining requests; a token whose budget dropped to `reserve`
+    is skipped until its reset time, after which it rejoins the rotation.
+    If all tokens are exhausted, `acquire` waits for the earliest reset.
+
+    Attributes:
+        tokens (List[Optional[str]]): Tokens in the pool (None = unauthenticated).
+        reserve (int): Remaining requests below which a token is rested.
+    """
+
+    def __init__(self, tokens: List[Optional[str]], reserve: int = 10):
+        self.tokens = list(tokens) or [None]
+        self.reserve = reserve
+        # Unknown budgets count as full until the first response reports them
+        self._remaining: Dict[Optional[str], float] = {token: float("inf") for token in self.tokens}
+        self._reset: Dict[Optional[str], float] = {token: 0.0 for token in self.tokens}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[str]:
+        """
+        Returns the token with the most headroom, waiting if every token is exhausted.
+        The lock is released while waiting, so other threads can still report responses.
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                for token in self.tokens:
+                    if self._remaining[token] <= self.reserve and self._reset[token] <= now:
+                        self._remaining[token] = float("inf")
+
+                token = max(self.tokens, key=lambda t: self._remaining[t])
+                if self._remaining[token] > self.reserve:
+                    # Count the request up front so concurrent callers spread over the pool
+                    self._remaining[token] -= 1
+                    return token
+
+                delay = min(self._reset.values()) - now
+            log.warning("All %d GitHub tokens are rate limited, sleeping %.0f seconds", len(self.tokens), delay)
+            time.sleep(max(delay, 1))
+
+    def update(self, token: Optional[str], headers: Mapping[str, str]) -> None:
+        """Records the rate-limit state reported by a response made with `token`."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            self._remaining[token] = int(remaining)
+            self._reset[token] = int(reset)
+
+    def exhausted(self, token: Optional[str]) -> bool:
+        """Returns True if the token is currently resting."""
+        with self._lock:
+            return self._remaining[token] <= self.reserve
+
+    def status(self) -> List[dict]:
+        """Returns the tracked budget of every token (tokens are masked)."""
+        with self._lock:
+            return [
+                {"token": token[:5] + "..." if token else None,
+                 "remaining": self._remaining[token],
+                 "reset": self._reset[token]}
+                for token in self.tokens
+            ]
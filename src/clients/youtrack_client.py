@@ -1,9 +1,12 @@
 import requests
 
+from src.clients.request_budget import RequestBudget
+
 
 class YouTrackClient:
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str, budget: RequestBudget = None):
         self.base_url = base_url.rstrip("/")
+        self.budget = budget or RequestBudget()
         # Hub API base (used for users, groups, permissions)
         self.hub_url = self.base_url.replace("/youtrack", "/hub")
         self.headers = {
@@ -12,6 +15,13 @@ class YouTrackClient:
             "Content-Type": "application/json"
         }
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request with the client's headers, counting it against the request budget.
+        """
+        self.budget.spend()
+        return requests.request(method, url, headers=self.headers, **kwargs)
+
     # --- Issues ---
     def get_issue(self, issue_id: str, fields: str = None) -> dict:
         """
@@ -19,25 +29,29 @@ class YouTrackClient:
         """
         params = {"fields": fields} if fields else {}
         url = f"{self.base_url}/api/issues/{issue_id}"
-        resp = requests.get(url, headers=self.headers, params=params)
+        resp = self._request("GET", url, params=params)
         resp.raise_for_status()
         return resp.json()
 
-    def create_issue(self, payload: dict) -> dict:
+    def create_issue(self, payload: dict, fields: str = None) -> dict:
         """
         Create a new issue in YouTrack.
+        `fields` selects which fields of the created issue are returned.
         """
+        params = {"fields": fields} if fields else {}
         url = f"{self.base_url}/api/issues"
-        resp = requests.post(url, headers=self.headers, json=payload)
+        resp = self._request("POST", url, json=payload, params=params)
         resp.raise_for_status()
         return resp.json()
 
-    def update_issue(self, issue_id: str, payload: dict) -> dict:
+    def update_issue(self, issue_id: str, payload: dict, fields: str = None) -> dict:
         """
         Update an existing issue by ID.
+        `fields` selects which fields of the updated issue are returned.
         """
+        params = {"fields": fields} if fields else {}
         url = f"{self.base_url}/api/issues/{issue_id}"
-        resp = requests.post(url, headers=self.headers, json=payload)
+        resp = self._request("POST", url, json=payload, params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -47,7 +61,34 @@ class YouTrackClient:
         """
         params = {"query": query, "fields": fields, "$top": top}
         url = f"{self.base_url}/api/issues"
-        resp = requests.get(url, headers=self.headers, params=params)
+        resp = self._request("GET", url, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    def iter_issues(self, query: str, fields: str = None, page_size: int = 500):
+        """
+        Iterate over all issues matching a query, one page at a time.
+        Pages are requested with `$top`/`$skip` until a short page is returned.
+        """
+        url = f"{self.base_url}/api/issues"
+        skip = 0
+        while True:
+            params = {"query": query, "fields": fields, "$top": page_size, "$skip": skip}
+            resp = self._request("GET", url, params=params)
+            resp.raise_for_status()
+            page = resp.json()
+            yield from page
+            if len(page) < page_size:
+                return
+            skip += page_size
+
+    def apply_command(self, query: str, issue_ids: list) -> dict:
+        """
+        Apply a YouTrack command (e.g. "tag Foo") to the given issues.
+        """
+        url = f"{self.base_url}/api/commands"
+        payload = {"query": query, "issues": [{"id": issue_id} for issue_id in issue_ids]}
+        resp = self._request("POST", url, json=payload)
         resp.raise_for_status()
         return resp.json()
 
@@ -57,7 +98,7 @@ class YouTrackClient:
         Get all users with basic info.
         """
         url = f"{self.base_url}/api/users?fields=id,ringId,login,name"
-        resp = requests.get(url, headers=self.headers)
+        resp = self._request("GET", url)
         resp.raise_for_status()
         return resp.json()
 
@@ -69,12 +110,18 @@ class YouTrackClient:
         if users:
             return users[0]
 
+        return self.create_user(login, name)
+
+    def create_user(self, login: str, name: str = None) -> dict:
+        """
+        Create a user in Hub.
+        """
         if not name:
             name = login
 
         url = f"{self.hub_url}/api/rest/users?fields=id,ringId,login,name"
         payload = {"login": login, "name": name}
-        resp = requests.post(url, headers=self.headers, json=payload)
+        resp = self._request("POST", url, json=payload)
         resp.raise_for_status()
         return resp.json()
 
@@ -85,7 +132,46 @@ class YouTrackClient:
         """
         url = f"{self.base_url}/api/issues/{issue_id}/assignee"
         payload = {"id": user_id}
-        resp = requests.post(url, headers=self.headers, json=payload)
+        resp = self._request("POST", url, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    # --- Tags ---
+    def get_tags(self) -> list[dict]:
+        """
+        Get all tags visible to the current user.
+        """
+        url = f"{self.base_url}/api/tags"
+        resp = self._request("GET", url, params={"fields": "id,name", "$top": -1})
+        resp.raise_for_status()
+        return resp.json()
+
+    def create_tag(self, name: str) -> dict:
+        """
+        Create a new tag.
+        """
+        url = f"{self.base_url}/api/tags"
+        resp = self._request("POST", url, json={"name": name}, params={"fields": "id,name"})
+        resp.raise_for_status()
+        return resp.json()
+
+    # --- Custom field bundles ---
+    def get_project_custom_fields(self, project_id: str) -> list[dict]:
+        """
+        Get a project's custom fields together with their bundle values.
+        """
+        url = f"{self.base_url}/api/admin/projects/{project_id}/customFields"
+        params = {"fields": "id,field(name),bundle(id,values(id,name))", "$top": -1}
+        resp = self._request("GET", url, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    def add_version_bundle_value(self, bundle_id: str, name: str) -> dict:
+        """
+        Add a new value (version) to a version bundle.
+        """
+        url = f"{self.base_url}/api/admin/customFieldSettings/bundles/version/{bundle_id}/values"
+        resp = self._request("POST", url, json={"name": name}, params={"fields": "id,name"})
         resp.raise_for_status()
         return resp.json()
 
@@ -95,7 +181,7 @@ class YouTrackClient:
         Fetch all user groups (so you can pick group_id to assign users to).
         """
         url = f"{self.hub_url}/api/rest/usergroups?fields=id,name"
-        resp = requests.get(url, headers=self.headers)
+        resp = self._request("GET", url)
         resp.raise_for_status()
         return resp.json()
 
@@ -105,7 +191,7 @@ class YouTrackClient:
         This is necessary to make them 'Assignable' in YouTrack.
         """
         url = f"{self.hub_url}/api/rest/users/{user_id}/groups"
-        resp = requests.post(url, headers=self.headers, json={"id": group_id})
+        resp = self._request("POST", url, json={"id": group_id})
         resp.raise_for_status()
         return resp.json()
 
@@ -116,7 +202,7 @@ class YouTrackClient:
         """
         url = f"{self.base_url}/api/admin/projects"
         params = {"fields": "id,ringId,shortName,name", "query": short_name}
-        resp = requests.get(url, headers=self.headers, params=params)
+        resp = self._request("GET", url, params=params)
         resp.raise_for_status()
         projects = resp.json()
         if not projects:
@@ -129,9 +215,9 @@ class YouTrackClient:
         usually you must also add them to a group with proper permissions).
         """
         url = f"{self.hub_url}/api/rest/projects/{project_ring_id}/team/users"
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             url,
-            headers=self.headers,
             json={"id": user_ring_id},
             params={"fields": "id,name"}
         )
@@ -144,7 +230,7 @@ class YouTrackClient:
         Generic POST to Hub API.
         """
         url = f"{self.hub_url}{path}"
-        resp = requests.post(url, headers=self.headers, json=json, params=params)
+        resp = self._request("POST", url, json=json, params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -153,6 +239,6 @@ class YouTrackClient:
         Generic GET to Hub API.
         """
         url = f"{self.hub_url}{path}"
-        resp = requests.get(url, headers=self.headers, params=params)
+        resp = self._request("GET", url, params=params)
         resp.raise_for_status()
         return resp.json()
@@ -2,9 +2,46 @@
 
 # --- GitHub ---
 GITHUB_TOKEN = "GITHUB_TOKEN_HERE"
+GITHUB_TOKENS = []  # optional pool of tokens (bots/app installations) used instead of GITHUB_TOKEN
+GITHUB_PAGE_WORKERS = 4  # concurrent page fetches when listing issues
+GITHUB_RATE_LIMIT_RESERVE = 10  # wait for the rate-limit reset below this many remaining requests
 
 # --- YouTrack ---
 YOUTRACK_TOKEN = "YOUTRACK_TOKEN_HERE"
 YOUTRACK_URL = "https://theos.youtrack.cloud"
 YOUTRACK_PROJECT = "GS"
-YOUTRACK_PROJECT_ID = "0-1"
\ No newline at end of file
+YOUTRACK_PROJECT_ID = "0-1"
+
+# --- Field mapping ---
+VERSION_FIELD = "Fix versions"  # YouTrack version field that receives GitHub milestones
+
+# --- Logging ---
+LOG_LEVEL = "INFO"
+LOG_FORMAT = "text"  # text | json
+LOG_ISSUE_SAMPLE_RATE = 1  # log every n-th per-issue message, 0 = cycle summaries only
+
+# --- Recency tiers (continuous sync) ---
+TIER_HOT_AGE = 7 * 86400  # issues updated within this many seconds are checked every cycle
+TIER_WARM_AGE = 90 * 86400  # issues updated within this many seconds are warm, older ones cold
+TIER_WARM_INTERVAL = 3600  # seconds between checks of a warm issue
+TIER_COLD_INTERVAL = 7 * 86400  # seconds in which the background sweep covers all cold issues
+
+# --- Freshness (lag between a GitHub edit and the YouTrack write) ---
+FRESHNESS_SLO_SECONDS = 300  # warn when the SLO percentile of a cycle exceeds this; None disables
+FRESHNESS_SLO_PERCENTILE = 95
+FRESHNESS_WINDOW_SAMPLES = 10000  # lag samples kept for the rolling percentiles
+
+# --- Memory budgets ---
+CACHE_MAX_ENTRIES = 10000  # entries per in-process cache (tags, versions, assignees)
+LOG_QUEUE_MAX_SIZE = 10000  # log records buffered for the background writer
+
+# --- Request budget ---
+MAX_REQUESTS = None  # per-run cap on GitHub + YouTrack requests (None = unlimited)
+
+# --- Local state ---
+STATE_DIR = ".gh2yt"
+
+# --- Reconciliation of issues deleted/transferred on GitHub ---
+RECONCILE_ACTION = "report"  # report | tag | close
+RECONCILE_TAG = "github-missing"
+RECONCILE_INTERVAL = 86400  # seconds between automatic reconciliations
@@ -1,15 +1,117 @@
 # logging_config.py
+import atexit
+import itertools
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Marks per-issue log records, e.g. log.info("...", extra=PER_ISSUE)
+PER_ISSUE = {"per_issue": True}
+
+# Seconds a warning or error waits for room in a full log queue before it is dropped
+# (only reached if the writer thread is stalled or already stopped at exit)
+WARNING_PUT_TIMEOUT = 5
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
 
-def configure_logging():
-    log = logging.getLogger()
-    log.setLevel(logging.INFO)
 
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue: records below WARNING are dropped
+    (and counted) instead of blocking the caller or growing memory when the
+    writer lags. Warnings and errors wait for room in the queue.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=WARNING_PUT_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def dropped_log_records() -> int:
+    """Returns the number of log records dropped so far by the bounded log queue."""
+    return sum(
+        handler.dropped for handler in logging.getLogger().handlers if isinstance(handler, DroppingQueueHandler)
     )
 
+
+class IssueLogSampler(logging.Filter):
+    """
+    Passes only every n-th per-issue INFO record.
+
+    Warnings and errors are never sampled. A rate of 0 drops per-issue
+    INFO records entirely, leaving only the per-cycle summaries.
+    """
+
+    def __init__(self, rate: int = 1):
+        super().__init__()
+        self.rate = rate
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "per_issue", False) or record.levelno > logging.INFO:
+            return True
+        if self.rate <= 0:
+            return False
+        return next(self._counter) % self.rate == 0
+
+
+def configure_logging(level: int = logging.INFO, fmt: str = "text", issue_sample_rate: int = 1,
+                      queue_max_size: int = 10000) -> QueueListener:
+    """
+    Routes all logging through a queue drained by a background thread,
+    so the sync loop never blocks on console I/O.
+
+    Args:
+        level (int): Root logger level.
+        fmt (str): "text" for human-readable lines, "json" for structured output.
+        issue_sample_rate (int): Log every n-th per-issue INFO record (0 = none).
+        queue_max_size (int): Memory budget of the log queue; records beyond it are dropped.
+
+    Returns:
+        QueueListener: The running listener; it is stopped automatically at exit.
+    """
+    log = logging.getLogger()
+    log.setLevel(level)
+
+    if fmt == "json":
+        formatter = JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    log.addHandler(console_handler)
+
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_max_size))
+    queue_handler.addFilter(IssueLogSampler(issue_sample_rate))
+    log.addHandler(queue_handler)
+
+    listener = QueueListener(queue_handler.queue, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
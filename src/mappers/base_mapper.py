@@ -3,6 +3,8 @@ from dateutil import parser as dateparser
 import logging
 from urllib.parse import quote
 
+from src.clients.request_budget import RequestBudgetExceeded
+
 log = logging.getLogger("gh2yt.mapper")
 
 class BaseMapper:
@@ -17,7 +19,7 @@ class BaseMapper:
         try:
             created = dateparser.parse(created_at).isoformat() if created_at else ""
         except Exception as e:
-            log.warning(f"Failed to parse creation date '{created_at}': {e}")
+            log.warning("Failed to parse creation date '%s': %s", created_at, e)
             created = created_at
 
         return (
@@ -37,8 +39,10 @@ class BaseMapper:
             if issues:
                 return issues[0].get("id")
             return None
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Greška pri pretrazi issues: {e}")
+            log.error("Greška pri pretrazi issues: %s", e)
             return None
 
 
@@ -72,7 +72,7 @@ class StateStrategy(FieldStrategy):
 
 class AssigneeStrategy(FieldStrategy):
     def create(self, issue: dict) -> dict | None:
-        assignee_login = issue.get("assignee_login")
+        assignee_login = self._get_assignee_login(issue, source="github")
         if not assignee_login:
             return None
 
@@ -135,3 +135,101 @@ class AssigneeStrategy(FieldStrategy):
         return None
 
 
+
+class LabelStrategy(FieldStrategy):
+    """
+    Mirrors GitHub labels as YouTrack tags.
+    Tags are referenced by name; IssueService resolves them to IDs before writing.
+
+    Only tags that came from labels are managed: updates are diffed against
+    the label names last synced for the issue (looked up with `synced_labels`),
+    and all other tags on the YouTrack issue are kept by ID. Issues without
+    a record only get missing labels added.
+    """
+    def __init__(self, synced_labels=None):
+        # number -> label names last written, or None if unknown
+        self.synced_labels = synced_labels
+
+    def create(self, issue: dict) -> dict | None:
+        labels = self.label_names(issue)
+        if not labels:
+            return None
+        return {"tags": [{"name": name} for name in labels]}
+
+    @staticmethod
+    def label_names(issue: dict) -> list:
+        return sorted({label.get("name") for label in issue.get("labels", []) if label.get("name")})
+
+    def update(self, current_issue: dict, new_issue: dict) -> dict | None:
+        current_tags = {tag.get("name") for tag in current_issue.get("tags", [])}
+        new_tags = self.label_names(new_issue)
+        synced = self.synced_labels(new_issue.get("number")) if self.synced_labels else None
+
+        if synced is None:
+            managed = set()
+            changed = not set(new_tags) <= current_tags
+        else:
+            managed = set(synced)
+            changed = new_tags != sorted(managed)
+
+        if not changed:
+            return None
+        kept = [
+            {"id": tag["id"]} for tag in current_issue.get("tags", [])
+            if tag.get("id") and tag.get("name") not in managed and tag.get("name") not in new_tags
+        ]
+        return {"tags": kept + [{"name": name} for name in new_tags]}
+
+
+class MilestoneStrategy(FieldStrategy):
+    """
+    Maps the GitHub milestone to a YouTrack version field (e.g. "Fix versions").
+    Versions are referenced by name; IssueService resolves them to IDs before writing.
+
+    If `field_values` is given, the strategy is a no-op for projects without
+    the field and ignores versions that could not be added to the bundle.
+    """
+    def __init__(self, field_name: str = "Fix versions", field_values=None):
+        self.field_name = field_name
+        self.field_values = field_values
+
+    def _enabled(self) -> bool:
+        return self.field_values is None or self.field_values.has_version_field()
+
+    def _versions(self, issue: dict) -> list:
+        milestone = issue.get("milestone")
+        if not milestone or not milestone.get("title"):
+            return []
+        if self.field_values and not self.field_values.version_available(milestone["title"]):
+            return []
+        return [milestone["title"]]
+
+    def _field(self, versions: list) -> dict:
+        return {
+            "customFields": [{
+                "name": self.field_name,
+                "$type": "MultiVersionIssueCustomField",
+                "value": [{"name": name} for name in versions]
+            }]
+        }
+
+    def create(self, issue: dict) -> dict | None:
+        versions = self._versions(issue)
+        if versions and self._enabled():
+            return self._field(versions)
+        return None
+
+    def update(self, current_issue: dict, new_issue: dict) -> dict | None:
+        if not self._enabled():
+            return None
+        new_versions = self._versions(new_issue)
+        current_versions = next(
+            (sorted(v.get("name") for v in cf.get("value") or [])
+             for cf in current_issue.get("customFields", [])
+             if cf.get("name") == self.field_name),
+            []
+        )
+
+        if new_versions != current_versions:
+            return self._field(new_versions)
+        return None
@@ -0,0 +1,118 @@
+import logging
+import threading
+from typing import Dict, Optional, Set
+
+from src.clients.request_budget import RequestBudgetExceeded
+from src.clients.youtrack_client import YouTrackClient
+from src.state.bounded_cache import BoundedDict
+
+log = logging.getLogger("gh2yt.services.field_values")
+
+
+class FieldValueCache:
+    """
+    Cached name -> ID index of YouTrack tags and version bundle values.
+
+    The index is loaded on first use and refreshed only when a name is
+    missing. Names that are still missing after a refresh are created once
+    and added to the index, so labelled issues need no extra lookups.
+    Versions that could not be added are remembered and not retried, so
+    the milestone mapping can skip them instead of diffing every cycle.
+
+    Attributes:
+        yt (YouTrackClient): Client for interacting with the YouTrack API.
+        project_id (str): The YouTrack project ID.
+        version_field (str): Name of the project's version custom field.
+        max_entries (int): Memory budget of each index, in entries.
+    """
+
+    def __init__(self, yt_client: YouTrackClient, project_id: str, version_field: str, max_entries: int = 10000):
+        self.yt = yt_client
+        self.project_id = project_id
+        self.version_field = version_field
+        self.max_entries = max_entries
+        self._tags: Optional[Dict[str, str]] = None
+        self._versions: Optional[Dict[str, str]] = None
+        self._bundle_id: Optional[str] = None
+        self._failed_versions: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def tag_id(self, name: str) -> Optional[str]:
+        """
+        Returns the ID of the tag with the given name, creating the tag if needed.
+        """
+        with self._lock:
+            if self._tags is None or name not in self._tags:
+                self._load_tags()
+            if name not in self._tags:
+                try:
+                    self._tags[name] = self.yt.create_tag(name)["id"]
+                    log.info("Created YouTrack tag '%s'", name)
+                except RequestBudgetExceeded:
+                    raise
+                except Exception as e:
+                    log.error("Error creating tag '%s': %s", name, e)
+                    return None
+            return self._tags[name]
+
+    def version_id(self, name: str) -> Optional[str]:
+        """
+        Returns the ID of the version with the given name, adding it to the bundle if needed.
+        """
+        with self._lock:
+            if name in self._failed_versions:
+                return None
+            if self._versions is None or name not in self._versions:
+                self._load_versions()
+            if name not in self._versions:
+                if not self._bundle_id:
+                    log.error("Project has no '%s' field, cannot add version '%s'", self.version_field, name)
+                    return None
+                try:
+                    self._versions[name] = self.yt.add_version_bundle_value(self._bundle_id, name)["id"]
+                    log.info("Added version '%s' to '%s'", name, self.version_field)
+                except RequestBudgetExceeded:
+                    raise
+                except Exception as e:
+                    log.error("Error adding version '%s': %s", name, e)
+                    self._failed_versions.add(name)
+                    return None
+            return self._versions[name]
+
+    def has_version_field(self) -> bool:
+        """Returns True if the project has the version field (loading the index if needed)."""
+        with self._lock:
+            if self._versions is None:
+                self._load_versions()
+            return self._bundle_id is not None
+
+    def version_available(self, name: str) -> bool:
+        """Returns False for versions that could not be added to the bundle earlier."""
+        return name not in self._failed_versions
+
+    def _load_tags(self) -> None:
+        try:
+            self._tags = BoundedDict(self.max_entries, ((tag["name"], tag["id"]) for tag in self.yt.get_tags()))
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error loading tags: %s", e)
+            self._tags = self._tags or BoundedDict(self.max_entries)
+
+    def _load_versions(self) -> None:
+        try:
+            fields = self.yt.get_project_custom_fields(self.project_id)
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error loading project custom fields: %s", e)
+            self._versions = self._versions or BoundedDict(self.max_entries)
+            return
+
+        self._versions = BoundedDict(self.max_entries)
+        for field in fields:
+            if (field.get("field") or {}).get("name") == self.version_field:
+                bundle = field.get("bundle") or {}
+                self._bundle_id = bundle.get("id")
+                self._versions.update((v["name"], v["id"]) for v in bundle.get("values", []))
+                return
@@ -2,12 +2,32 @@ import logging
 import pprint
 from typing import Dict, Optional
 from src.mappers.issue_mapper import IssueMapper
-from src.mappers.field_strategies import DescriptionStrategy, StateStrategy, AssigneeStrategy, SummaryStrategy
+from src.mappers.field_strategies import (
+    DescriptionStrategy, StateStrategy, AssigneeStrategy, SummaryStrategy, LabelStrategy, MilestoneStrategy
+)
 
+from src.clients.request_budget import RequestBudgetExceeded
 from src.clients.youtrack_client import YouTrackClient
+from src.logging_config import PER_ISSUE
+from src.services.field_value_cache import FieldValueCache
 
 log = logging.getLogger("gh2yt.services.issue")
 
+# Fields the mapping strategies compare against; also requested on every write
+ISSUE_FIELDS = (
+    "id,idReadable,numberInProject,updated,summary,description,"
+    "customFields(name,value(name,login)),tags(id,name)"
+)
+
+
+class IssueNotFound(LookupError):
+    """Raised when a YouTrack issue that is written to no longer exists (HTTP 404)."""
+
+
+def _is_not_found(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 404
+
 
 class IssueService:
     """
@@ -22,17 +42,22 @@ class IssueService:
         project_id (str): The YouTrack project ID.
         project_short (str): Short identifier of the project in YouTrack.
         mapper (IssueMapper): Mapper for transforming GitHub issue fields into YouTrack format.
+        field_values (FieldValueCache): Name -> ID index of tags and versions used when writing.
     """
-    def __init__(self, yt_client: YouTrackClient, project_id: str, project_short: str):
+    def __init__(self, yt_client: YouTrackClient, project_id: str, project_short: str,
+                 version_field: str = "Fix versions", cache_max_entries: int = 10000, synced_labels=None):
         self.yt = yt_client
         self.project_id = project_id
         self.project_short = project_short
+        self.field_values = FieldValueCache(yt_client, project_id, version_field, cache_max_entries)
 
         self.mapper = IssueMapper([
             SummaryStrategy(),
             DescriptionStrategy(),
             StateStrategy(),
-            AssigneeStrategy()
+            AssigneeStrategy(),
+            LabelStrategy(synced_labels),
+            MilestoneStrategy(version_field, self.field_values)
         ])
 
     def create_issue(self, issue: dict) -> Optional[dict]:
@@ -40,10 +65,33 @@ class IssueService:
         Creates a new issue from dict(JSON) in YouTrack.
         """
         payload = self.mapper.map_create(issue, self.project_id)
+        return self.create_issue_from_payload(payload)
+
+    def create_issue_from_payload(self, payload: dict) -> Optional[dict]:
+        """
+        Creates a new issue in YouTrack from an already mapped payload.
+        """
         try:
-            return self.yt.create_issue(payload)
+            return self.yt.create_issue(self._resolve_values(payload), fields=ISSUE_FIELDS)
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error creating issue: {e}")
+            log.error("Error creating issue: %s", e)
+            return None
+
+    def update_issue_from_payload(self, yt_id: str, payload: dict) -> Optional[dict]:
+        """
+        Applies an already mapped update payload to an existing YouTrack issue.
+        Raises IssueNotFound if the issue was deleted in YouTrack.
+        """
+        try:
+            return self.yt.update_issue(yt_id, self._resolve_values(payload), fields=ISSUE_FIELDS)
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            if _is_not_found(e):
+                raise IssueNotFound(yt_id) from e
+            log.error("Error triying to update issue with ID-%s: %s", yt_id, e)
             return None
 
     def update_issue(self, current_issue: dict, new_issue: dict, yt_id: str) -> Optional[dict]:
@@ -57,28 +105,95 @@ class IssueService:
 
         Returns:
             Optional[dict]: Updated issue data from YouTrack, or None if no changes were detected.
+
+        Raises:
+            IssueNotFound: The issue was deleted in YouTrack.
         """
         payload = self.mapper.map_update(current_issue, new_issue)
 
         if not payload:
-            log.info(f"No changes detected for issue with ID-{yt_id} | Number {new_issue['number']}")
+            log.info("No changes detected for issue with ID-%s | Number %s", yt_id, new_issue['number'], extra=PER_ISSUE)
             return None
         else:
-            log.info(f"Updated issue with ID-{yt_id} | Number {new_issue['number']}")
+            log.info("Updated issue with ID-%s | Number %s", yt_id, new_issue['number'], extra=PER_ISSUE)
         try:
-            return self.yt.update_issue(yt_id, payload)
+            return self.yt.update_issue(yt_id, self._resolve_values(payload), fields=ISSUE_FIELDS)
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error triying to update issue with ID-{yt_id} | Number {new_issue['number']}: {e}")
+            if _is_not_found(e):
+                raise IssueNotFound(yt_id) from e
+            log.error("Error triying to update issue with ID-%s | Number %s: %s", yt_id, new_issue['number'], e)
             return None
 
+    def _resolve_values(self, payload: dict) -> dict:
+        """
+        Replaces tag and version names produced by the strategies with YouTrack IDs.
+        Values that cannot be resolved are dropped; a version field none of whose
+        versions resolve is left out of the payload entirely.
+        """
+        resolved = dict(payload)
+        if "tags" in payload:
+            ids = (tag.get("id") or self.field_values.tag_id(tag["name"]) for tag in payload["tags"])
+            resolved["tags"] = [{"id": tag_id} for tag_id in ids if tag_id]
+
+        if "customFields" in payload:
+            resolved["customFields"] = []
+            for field in payload["customFields"]:
+                if field.get("name") == self.field_values.version_field:
+                    names = [v["name"] for v in field.get("value") or []]
+                    ids = [version_id for version_id in map(self.field_values.version_id, names) if version_id]
+                    if names and not ids:
+                        continue
+                    field = dict(field, value=[{"id": version_id} for version_id in ids])
+                resolved["customFields"].append(field)
+            if not resolved["customFields"]:
+                del resolved["customFields"]
+        return resolved
+
+    def add_tag(self, yt_id: str, tag: str) -> bool:
+        """
+        Adds a tag to an existing YouTrack issue.
+        """
+        try:
+            self.yt.apply_command(f"tag {tag}", [yt_id])
+            return True
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error tagging issue ID-%s with '%s': %s", yt_id, tag, e)
+            return False
+
+    def close_issue(self, yt_id: str) -> Optional[dict]:
+        """
+        Moves an existing YouTrack issue to the state mapped from a closed GitHub issue.
+        """
+        payload = StateStrategy().create({"state": "closed"})
+        return self.update_issue_from_payload(yt_id, payload)
+
     def get_issue(self, yt_id: str) -> Optional[dict]:
         """
         Retrieves an issue from YouTrack by its ID.
         """
         try:
-            return self.yt.get_issue(yt_id, fields="id,summary,description,customFields(name,value(name,login))")
+            return self.yt.get_issue(yt_id, fields=ISSUE_FIELDS)
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error getting issue ID-%s: %s", yt_id, e)
+            return None
+
+    def project_has_issues(self) -> Optional[bool]:
+        """
+        Checks with a single `$top=1` query whether the project contains any issue.
+        Returns None if the check failed.
+        """
+        try:
+            return bool(self.yt.search_issues(query=f"project: {self.project_short}", fields="id", top=1))
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error getting issue ID-{yt_id}: {e}")
+            log.error("Error checking whether project %s has issues: %s", self.project_short, e)
             return None
 
     def find_existing_issue_id(self, number: int) -> Optional[str]:
@@ -93,7 +208,9 @@ class IssueService:
         """
         try:
             return self.mapper.get_existing_issue_id(self.yt, self.project_short, number=number)
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error finding issue '{number}': {e}")
+            log.error("Error finding issue '%s': %s", number, e)
             return None
 
@@ -1,7 +1,9 @@
 import logging
 import pprint
-from typing import Optional
+from typing import Optional, Set
+from src.clients.request_budget import RequestBudgetExceeded
 from src.clients.youtrack_client import YouTrackClient
+from src.state.bounded_cache import BoundedDict
 
 log = logging.getLogger("gh2yt.services.project")
 
@@ -16,10 +18,12 @@ class ProjectService:
 
     Attributes:
         yt (YouTrackClient): Client for interacting with the YouTrack API.
+        ring_ids (BoundedDict): Cache of project ring IDs keyed by short name.
     """
 
-    def __init__(self, yt_client: YouTrackClient):
+    def __init__(self, yt_client: YouTrackClient, cache_max_entries: int = 10000):
         self.yt = yt_client
+        self.ring_ids = BoundedDict(cache_max_entries)
 
     def get_project_ring_id(self, short_name: str) -> Optional[str]:
         """
@@ -31,17 +35,22 @@ class ProjectService:
         Returns:
             Optional[str]: Ring ID of the project if found; otherwise, None.
         """
+        if short_name in self.ring_ids:
+            return self.ring_ids[short_name]
         try:
             params = {"fields": "id,ringId,shortName,name", "query": short_name}
-            log.debug(f"[YT][Project] Fetching project by shortName='{short_name}' with params={params}")
+            log.debug("[YT][Project] Fetching project by shortName='%s' with params=%s", short_name, params)
             projects = self.yt.hub_get("/api/admin/projects", params=params)
 
-            log.debug(f"[YT][Project] Response projects={projects}")
+            log.debug("[YT][Project] Response projects=%s", projects)
             if projects:
-                return projects[0].get("ringId")
-            log.warning(f"[YT][Project] Project with shortName '{short_name}' not found.")
+                self.ring_ids[short_name] = projects[0].get("ringId")
+                return self.ring_ids[short_name]
+            log.warning("[YT][Project] Project with shortName '%s' not found.", short_name)
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"[YT][Project] Error fetching project '{short_name}': {e}", exc_info=True)
+            log.error("[YT][Project] Error fetching project '%s': %s", short_name, e, exc_info=True)
         return None
 
     def is_user_in_project(self, project_short: str, user_ring_id: str) -> bool:
@@ -58,22 +67,49 @@ class ProjectService:
         try:
             ring_id = self.get_project_ring_id(project_short)
             if not ring_id:
-                log.error(f"Cannot get ringId for project '{project_short}'")
+                log.error("Cannot get ringId for project '%s'", project_short)
                 return False
 
             path = f"/hub/api/rest/projects/{ring_id}/team/users"
             members = self.yt.hub_get(path, params={"fields": "id,login"})
 
-            log.debug(f"[YT][Project] Members in project '{project_short}': {members}")
+            log.debug("[YT][Project] Members in project '%s': %s", project_short, members)
 
             for member in members.get("users", []):
                 if member.get("id") == user_ring_id:
-                    log.debug(f"[YT][Project] User ringId={user_ring_id} is already in project '{project_short}'")
+                    log.debug("[YT][Project] User ringId=%s is already in project '%s'", user_ring_id, project_short)
                     return True
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error checking if user is in project '{project_short}': {e}", exc_info=True)
+            log.error("Error checking if user is in project '%s': %s", project_short, e, exc_info=True)
         return False
 
+    def get_project_member_ids(self, project_short: str) -> Optional[Set[str]]:
+        """
+        Fetches the ring IDs of all members of a project's team in one request.
+
+        Args:
+            project_short (str): Short name of the project in YouTrack.
+
+        Returns:
+            Optional[Set[str]]: Ring IDs of the team members, or None on error.
+        """
+        try:
+            ring_id = self.get_project_ring_id(project_short)
+            if not ring_id:
+                log.error("Cannot get ringId for project '%s'", project_short)
+                return None
+
+            path = f"/hub/api/rest/projects/{ring_id}/team/users"
+            members = self.yt.hub_get(path, params={"fields": "id,login", "$top": -1})
+            return {member.get("id") for member in members.get("users", [])}
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error fetching members of project '%s': %s", project_short, e, exc_info=True)
+            return None
+
     def add_user_to_project_team(self, project_short: str, user_ring_id: str) -> bool:
         """
         Adds a user to a YouTrack project's team.
@@ -88,19 +124,21 @@ class ProjectService:
         try:
             ring_id = self.get_project_ring_id(project_short)
             if not ring_id:
-                log.error(f"[YT][Project] Could not get ringId for project '{project_short}'")
+                log.error("[YT][Project] Could not get ringId for project '%s'", project_short)
                 return False
 
             path = f"/hub/api/rest/projects/{ring_id}/team/users"
             payload = {"id": user_ring_id}
             params = {"fields": "name,id"}
-            log.debug(f"[YT][Project] Adding user ringId={user_ring_id} to project '{project_short}' -> path={path}, payload={payload}")
+            log.debug("[YT][Project] Adding user ringId=%s to project '%s' -> path=%s, payload=%s", user_ring_id, project_short, path, payload)
 
             response = self.yt.hub_post(path, json=payload, params=params)
-            log.info(f"[YT][Project] User ringId={user_ring_id} added to project '{project_short}'. Response={response}")
+            log.info("[YT][Project] User ringId=%s added to project '%s'. Response=%s", user_ring_id, project_short, response)
             return True
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"[YT][Project] Error adding user ringId={user_ring_id} to project '{project_short}': {e}", exc_info=True)
+            log.error("[YT][Project] Error adding user ringId=%s to project '%s': %s", user_ring_id, project_short, e, exc_info=True)
             return False
 
 
@@ -1,8 +1,13 @@
 import logging
+from typing import Dict, List, Optional
 from src.clients.youtrack_client import YouTrackClient
+from src.mappers.field_strategies import LabelStrategy
 from src.services.user_service import UserService
-from src.services.issue_service import IssueService
+from src.services.issue_service import IssueNotFound, IssueService
 from src.services.project_service import ProjectService
+from src.services.snapshot_service import SnapshotService
+from src.state.bounded_cache import BoundedDict
+from src.state.state_store import StateStore
 
 log = logging.getLogger("gh2yt.orchestrator")
 
@@ -13,15 +18,56 @@ class ServiceOrchestrator:
     - AssignmentService: ensures users exist in YouTrack
     - ProjectService: ensures users are part of a project team
     - IssueService: handles creation and updates of issues
+    - SnapshotService: keeps a local copy of the project's issues
     """
 
-    def __init__(self, yt_client: YouTrackClient, project_short: str, project_id: str):
-        self.project_service = ProjectService(yt_client)
+    def __init__(self, yt_client: YouTrackClient, project_short: str, project_id: str,
+                 state_store: StateStore = None, version_field: str = "Fix versions",
+                 cache_max_entries: int = 10000):
+        self.project_service = ProjectService(yt_client, cache_max_entries)
         self.user_service = UserService(yt_client)
-        self.issue_service = IssueService(yt_client, project_id, project_short)
+        self.snapshot_service = SnapshotService(yt_client, project_short, state_store)
+        self.issue_service = IssueService(
+            yt_client, project_id, project_short, version_field, cache_max_entries,
+            synced_labels=self.snapshot_service.synced_labels
+        )
         self.project_short = project_short
         self.project_id = project_id
+        # login -> whether the user can be assigned (None = unknown), filled by `prepare_assignees`
+        self.valid_assignees: Dict[str, Optional[bool]] = BoundedDict(cache_max_entries)
 
+    def refresh_snapshot(self, full: bool = False):
+        """Loads or incrementally refreshes the local snapshot of YouTrack issues"""
+        self.snapshot_service.refresh(full=full)
+
+    def save_snapshot(self):
+        """Persists the local snapshot of YouTrack issues"""
+        self.snapshot_service.save()
+
+    def get_cached_issue(self, number: int) -> dict:
+        """Returns the snapshot copy of the YouTrack issue imported from a GitHub number"""
+        return self.snapshot_service.get(number)
+
+
+    def cached_numbers(self) -> set:
+        """Returns the GitHub numbers of all issues in the snapshot"""
+        return {int(number) for number in self.snapshot_service.issues_by_number()}
+
+    def tag_issue(self, yt_id: str, tag: str) -> bool:
+        """Adds a tag to a YouTrack issue"""
+        return self.issue_service.add_tag(yt_id, tag)
+
+    def close_issue(self, yt_id: str) -> dict:
+        """Closes a YouTrack issue"""
+        try:
+            return self._remember(self.issue_service.close_issue(yt_id))
+        except IssueNotFound:
+            self._forget(yt_id)
+            return None
+
+    def project_has_issues(self):
+        """Cheaply checks whether the YouTrack project contains any issue (None if unknown)"""
+        return self.issue_service.project_has_issues()
 
     def find_existing_issue_id(self, number: int):
         """Searches for an issue by summary text"""
@@ -35,9 +81,16 @@ class ServiceOrchestrator:
         """
         Ensures assignee is valid before updating an issue.
         Passes the prepared issue to IssueService.
+        If the issue was deleted in YouTrack, it is created again.
         """
-        new_issue = self._prepare_assignee(new_issue)
-        return self.issue_service.update_issue(current, new_issue, yt_id)
+        new_issue = self._prepare_assignee(new_issue, current)
+        try:
+            updated = self.issue_service.update_issue(current, new_issue, yt_id)
+        except IssueNotFound:
+            self._forget(yt_id)
+            log.warning("Issue ID-%s was deleted in YouTrack, recreating GH #%s", yt_id, new_issue.get("number"))
+            updated = self.issue_service.create_issue(new_issue)
+        return self._remember(updated, LabelStrategy.label_names(new_issue))
 
     def create_issue(self, issue: dict) -> dict:
         """
@@ -45,16 +98,73 @@ class ServiceOrchestrator:
         Passes the prepared issue to IssueService.
         """
         issue = self._prepare_assignee(issue)
-        return self.issue_service.create_issue(issue)
+        return self._remember(self.issue_service.create_issue(issue), LabelStrategy.label_names(issue))
+
+    def map_create(self, issue: dict) -> dict:
+        """Maps a GitHub issue to a YouTrack create payload without any writes"""
+        return self.issue_service.mapper.map_create(issue, self.project_id)
+
+    def map_update(self, current: dict, new_issue: dict) -> dict:
+        """Computes the YouTrack update payload for an issue without any writes"""
+        return self.issue_service.mapper.map_update(current, new_issue)
+
+    def needs_update(self, current: dict, new_issue: dict, validate: bool = False) -> bool:
+        """
+        Checks whether writing a GitHub issue would change its YouTrack issue,
+        comparing the assignee that would actually be written. Unless `validate`
+        is set, assignees without a known result are compared as they are
+        instead of being validated (which costs requests).
+        """
+        return bool(self.map_update(current, self._prepare_assignee(new_issue, current, validate=validate)))
+
+    def submit_create(self, payload: dict) -> dict:
+        """Creates an issue from a payload produced by `map_create`"""
+        return self._remember(self.issue_service.create_issue_from_payload(payload), self._payload_labels(payload, []))
+
+    def submit_update(self, yt_id: str, payload: dict) -> dict:
+        """Updates an issue with a payload produced by `map_update`"""
+        try:
+            return self._remember(
+                self.issue_service.update_issue_from_payload(yt_id, payload), self._payload_labels(payload)
+            )
+        except IssueNotFound:
+            # The next plan turns the issue into a create
+            self._forget(yt_id)
+            return None
+
+    @staticmethod
+    def _payload_labels(payload: dict, default: Optional[List[str]] = None) -> Optional[List[str]]:
+        """Label names written by a payload (tags referenced by name), or `default` if it has no tags"""
+        if "tags" not in payload:
+            return default
+        return [tag["name"] for tag in payload["tags"] if "name" in tag]
+
+    def _remember(self, yt_issue: dict, labels: Optional[List[str]] = None) -> dict:
+        """Writes the issue returned by YouTrack, and the labels written to it, through to the snapshot"""
+        if yt_issue:
+            self.snapshot_service.put(yt_issue)
+            number = self.snapshot_service.github_number(yt_issue)
+            if labels is not None and number is not None:
+                self.snapshot_service.record_labels(number, labels)
+        return yt_issue
+
 
+    def _forget(self, yt_id: str) -> None:
+        """Drops an issue deleted in YouTrack from the snapshot, so it is created again"""
+        log.warning("Issue ID-%s no longer exists in YouTrack, removing it from the snapshot", yt_id)
+        self.snapshot_service.discard(yt_id)
 
-    def _prepare_assignee(self, issue: dict) -> dict:
+    def _prepare_assignee(self, issue: dict, current: Optional[dict] = None, validate: bool = True) -> dict:
         """
         Validates and prepares the assignee for the given issue:
         1. Checks if the assignee is provided
         2. Ensures the user exists in YouTrack (creates if missing)
         3. Ensures the user is part of the project team (adds if missing)
         4. If user cannot be validated, clears the assignee field
+        5. If it is unknown whether the user is valid (the user listing failed),
+           keeps the assignee of the `current` YouTrack issue unchanged
+        Returns a prepared copy; the given issue is not modified. Without
+        `validate`, only already known results are applied.
         """
         if not issue.get("assignee"):
             return issue
@@ -65,16 +175,94 @@ class ServiceOrchestrator:
         if not assignee_login:
             return issue
 
-        user = self.user_service.ensure_user_exists(assignee_login, assignee_name)
-        if not user:
-            log.warning(f"Assignee '{assignee_login}' could not be created/found -> removing assignee")
-            issue["assignee"] = None
+        if assignee_login in self.valid_assignees:
+            valid = self.valid_assignees[assignee_login]
+        elif not validate:
             return issue
+        else:
+            valid = self.valid_assignees[assignee_login] = self.ensure_assignee(assignee_login, assignee_name)
+
+        if valid is None:
+            if not validate:
+                return issue
+            current_login = next(
+                (cf["value"].get("login") for cf in (current or {}).get("customFields", [])
+                 if cf.get("name") == "Assignee" and cf.get("value")),
+                None
+            )
+            return dict(issue, assignee={"login": current_login} if current_login else None)
+        if not valid:
+            return dict(issue, assignee=None)
+        return issue
+
+    @staticmethod
+    def collect_assignees(issues: List[dict]) -> Dict[str, Optional[str]]:
+        """Returns the distinct assignee logins (mapped to names) of GitHub issues"""
+        return {
+            issue["assignee"]["login"]: issue["assignee"].get("name")
+            for issue in issues
+            if issue.get("assignee") and issue["assignee"].get("login")
+        }
+
+    def prepare_assignees(self, assignees: Dict[str, Optional[str]]) -> Dict[str, Optional[bool]]:
+        """
+        Pre-pass validating all distinct assignees of a batch at once:
+        1. Resolves or creates all users with a single user listing
+        2. Fetches the project team once
+        3. Adds only the missing users to the team
+        The results are used by `_prepare_assignee` instead of per-issue checks.
+        They are kept across cycles, so an assignee that cannot be used is not
+        retried until one of its issues changes again. If the user listing
+        fails, every assignee is marked unknown (None) and left unchanged on
+        existing issues rather than removed.
+        """
+        if not assignees:
+            return {}
+
+        users = self.user_service.ensure_users_exist(assignees)
+        if users is None:
+            log.warning("Users could not be listed -> keeping current assignees of %d logins", len(assignees))
+            results = {login: None for login in assignees}
+            self.valid_assignees.update(results)
+            return results
+
+        members = self.project_service.get_project_member_ids(self.project_short)
+
+        results = {}
+        for login in assignees:
+            user = users.get(login)
+            if not user:
+                log.warning("Assignee '%s' could not be created/found -> removing assignee", login)
+                results[login] = False
+                continue
+
+            ring_id = user.get("ringId")
+            if members is not None and ring_id in members:
+                results[login] = True
+            elif self.project_service.add_user_to_project_team(self.project_short, ring_id):
+                results[login] = True
+            else:
+                log.warning("User '%s' could not be added to project '%s' -> removing assignee", login, self.project_short)
+                results[login] = False
+
+        self.valid_assignees.update(results)
+        log.info("Prepared %d distinct assignees (%d valid)", len(results), sum(results.values()))
+        return results
+
+    def ensure_assignee(self, login: str, name: str = None) -> bool:
+        """
+        Ensures the user exists in YouTrack and is part of the project team.
+        Returns False if the user cannot be used as an assignee.
+        """
+        user = self.user_service.ensure_user_exists(login, name)
+        if not user:
+            log.warning("Assignee '%s' could not be created/found -> removing assignee", login)
+            return False
 
         ring_id = user.get("ringId")
         if not self.project_service.is_user_in_project(self.project_short, ring_id):
-            if not self.project_service.add_user_to_project_team(self.project_short,ring_id):
-                log.warning(f"User '{assignee_login}' could not be added to project '{self.project_short}' -> removing assignee")
-                issue["assignee"] = None
+            if not self.project_service.add_user_to_project_team(self.project_short, ring_id):
+                log.warning("User '%s' could not be added to project '%s' -> removing assignee", login, self.project_short)
+                return False
 
-        return issue
+        return True
@@ -0,0 +1,145 @@
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from src.clients.youtrack_client import YouTrackClient
+from src.services.issue_service import ISSUE_FIELDS
+from src.state.state_store import StateStore
+
+log = logging.getLogger("gh2yt.services.snapshot")
+
+# Matches the "Number: N" line written by BaseMapper.format_description
+_GITHUB_NUMBER_RE = re.compile(r"^Number: (\d+)\s*$", re.MULTILINE)
+
+
+class SnapshotService:
+    """
+    Local snapshot of all YouTrack issues in the target project.
+
+    The snapshot is loaded with a single paged query and indexed by GitHub
+    issue number. Only issues carrying the "Number: N" import marker are
+    indexed; issues created directly in YouTrack are ignored, as their
+    YouTrack numbers say nothing about GitHub. Later refreshes only request
+    issues updated since the previous refresh, so diffs can run against
+    local data instead of looking up and fetching every issue separately.
+    Incremental refreshes cannot see deletions; the entry of an issue deleted
+    in YouTrack is dropped once a write to it fails with 404.
+
+    Attributes:
+        yt (YouTrackClient): Client for interacting with the YouTrack API.
+        project_short (str): Short identifier of the project in YouTrack.
+        state (Optional[StateStore]): Store used to persist the snapshot between runs.
+        issues (Dict[str, dict]): YouTrack issues keyed by GitHub issue number.
+        refreshed_at (Optional[str]): ISO timestamp of the last successful refresh.
+        labels (Dict[str, List[str]]): GitHub label names last written as tags, keyed by GitHub number.
+    """
+
+    def __init__(self, yt_client: YouTrackClient, project_short: str,
+                 state_store: Optional[StateStore] = None, page_size: int = 500):
+        self.yt = yt_client
+        self.project_short = project_short
+        self.state = state_store
+        self.page_size = page_size
+        self.issues: Dict[str, dict] = {}
+        self.refreshed_at: Optional[str] = None
+        self.labels: Dict[str, List[str]] = {}
+        self._loaded = False
+
+    @staticmethod
+    def github_number(yt_issue: dict) -> Optional[int]:
+        """
+        Returns the GitHub issue number a YouTrack issue was imported from,
+        or None if the description has no import marker.
+        """
+        match = _GITHUB_NUMBER_RE.search(yt_issue.get("description") or "")
+        return int(match.group(1)) if match else None
+
+    def get(self, number: int) -> Optional[dict]:
+        """Returns the snapshot entry for a GitHub issue number."""
+        self._restore()
+        return self.issues.get(str(number))
+
+    def put(self, yt_issue: dict) -> None:
+        """Adds or replaces a YouTrack issue in the snapshot."""
+        self._restore()
+        number = self.github_number(yt_issue)
+        if number is not None:
+            self.issues[str(number)] = yt_issue
+
+    def discard(self, yt_id: str) -> None:
+        """Removes the entry of a YouTrack issue that no longer exists."""
+        self._restore()
+        for key, yt_issue in list(self.issues.items()):
+            if yt_issue.get("id") == yt_id:
+                del self.issues[key]
+                self.labels.pop(key, None)
+
+    def synced_labels(self, number: int) -> Optional[List[str]]:
+        """Returns the label names last written to the issue, or None if unknown."""
+        self._restore()
+        return self.labels.get(str(number))
+
+    def record_labels(self, number: int, names: List[str]) -> None:
+        """Remembers the label names written to the issue imported from `number`."""
+        self._restore()
+        self.labels[str(number)] = sorted(names)
+
+    def issues_by_number(self) -> Dict[str, dict]:
+        """Returns the whole index of YouTrack issues keyed by GitHub number."""
+        self._restore()
+        return self.issues
+
+    def __len__(self) -> int:
+        self._restore()
+        return len(self.issues)
+
+    def refresh(self, full: bool = False) -> None:
+        """
+        Brings the snapshot up to date with YouTrack.
+
+        The first call restores the persisted snapshot; if none exists (or
+        `full` is set) all project issues are loaded. Otherwise only issues
+        updated since the last refresh are requested.
+        """
+        self._restore()
+
+        started_at = datetime.now(timezone.utc)
+        if full or not self.refreshed_at:
+            self.issues = {}
+            query = f"project: {self.project_short}"
+        else:
+            # Date granularity re-reads the last day, which keeps the refresh safe against clock skew
+            since = datetime.fromisoformat(self.refreshed_at).strftime("%Y-%m-%d")
+            query = f"project: {self.project_short} updated: {since} .. Today"
+
+        count = 0
+        for yt_issue in self.yt.iter_issues(query, fields=ISSUE_FIELDS, page_size=self.page_size):
+            self.put(yt_issue)
+            count += 1
+
+        self.refreshed_at = started_at.isoformat()
+        log.info("Snapshot refreshed with %d issues (query='%s'), %d indexed", count, query, len(self.issues))
+
+    def save(self) -> None:
+        """Persists the snapshot to the state store, if one is configured."""
+        if self.state is not None and self._loaded:
+            self.state.write("snapshot", {"refreshed_at": self.refreshed_at, "issues": self.issues, "labels": self.labels})
+            # Summary kept in the small meta document so it can be read without the snapshot
+            self.state.update_meta(snapshot_refreshed_at=self.refreshed_at, mapped_issues=len(self.issues))
+
+    def _restore(self) -> None:
+        """Loads the persisted snapshot once, before first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.state is None:
+            return
+        data = self.state.read("snapshot", {})
+        # Snapshots written by older versions also indexed unmarked issues by their YouTrack number
+        self.issues = {
+            key: yt_issue for key, yt_issue in data.get("issues", {}).items()
+            if str(self.github_number(yt_issue)) == key
+        }
+        self.refreshed_at = data.get("refreshed_at")
+        self.labels = data.get("labels", {})
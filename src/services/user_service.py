@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional
+from src.clients.request_budget import RequestBudgetExceeded
 from src.clients.youtrack_client import YouTrackClient
 
 log = logging.getLogger("gh2yt.services.assignment")
@@ -31,8 +32,10 @@ class UserService:
         try:
             users = self.yt.get_users()
             return any(user.get("login") == login for user in users)
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error checking user '{login}': {e}")
+            log.error("Error checking user '%s': %s", login, e)
             return False
 
     def get_user_ring_id(self, login: str) -> Optional[str]:
@@ -50,8 +53,10 @@ class UserService:
             for user in users:
                 if user.get("login") == login:
                     return user.get("ringId")
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Errir retrieving ringId for user '{login}': {e}")
+            log.error("Errir retrieving ringId for user '%s': %s", login, e)
         return None
 
     def ensure_user_exists(self, login: str, name: Optional[str] = None) -> Optional[dict]:
@@ -69,6 +74,40 @@ class UserService:
             user = self.yt.get_or_create_user(login = login, name = name)
             return user
 
+        except RequestBudgetExceeded:
+            raise
         except Exception as e:
-            log.error(f"Error creating or retrieving user '{login} '{login}': {e}")
+            log.error("Error creating or retrieving user '%s '%s': %s", login, login, e)
             return None
+
+    def ensure_users_exist(self, users: Dict[str, Optional[str]]) -> Optional[Dict[str, dict]]:
+        """
+        Ensures that all given users exist in YouTrack using a single user listing.
+
+        Args:
+            users (Dict[str, Optional[str]]): Logins mapped to full names (optional).
+
+        Returns:
+            Optional[Dict[str, dict]]: User objects for the logins that were found or created,
+            or None if the users could not be listed (nothing is known about them).
+        """
+        try:
+            existing = {user.get("login"): user for user in self.yt.get_users()}
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error listing users: %s", e)
+            return None
+
+        result = {}
+        for login, name in users.items():
+            if login in existing:
+                result[login] = existing[login]
+                continue
+            try:
+                result[login] = self.yt.create_user(login=login, name=name)
+            except RequestBudgetExceeded:
+                raise
+            except Exception as e:
+                log.error("Error creating user '%s': %s", login, e)
+        return result
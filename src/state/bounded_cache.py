@@ -0,0 +1,39 @@
+# bounded_cache.py
+from collections import OrderedDict
+
+
+class BoundedDict(OrderedDict):
+    """
+    Dictionary with a fixed memory budget expressed as a maximum number of entries.
+
+    Entries are kept in least-recently-used order; reading or writing a key
+    marks it as recently used, and the oldest entries are evicted once the
+    budget is exceeded. Used for the in-process lookup caches that live
+    across sync cycles (tags, versions, assignees, project ring IDs). The
+    snapshot index and the tier schedule are not bounded this way: they hold
+    one entry per issue, so they grow with the project, not with the number
+    of cycles, and evicting from them would cause duplicate creates.
+
+    Attributes:
+        max_entries (int): Maximum number of entries kept.
+    """
+
+    def __init__(self, max_entries: int, *args, **kwargs):
+        self.max_entries = max_entries
+        super().__init__(*args, **kwargs)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_entries:
+            self.popitem(last=False)
@@ -0,0 +1,75 @@
+# state_store.py
+import json
+import logging
+import os
+import tempfile
+from typing import Any
+
+log = logging.getLogger("gh2yt.state")
+
+DEFAULT_STATE_DIR = ".gh2yt"
+
+
+class StateStore:
+    """
+    Local, file-based state shared between sync runs.
+
+    Every named document is kept in its own JSON file inside ``state_dir``,
+    so small documents (metadata, journal) can be read without loading
+    large ones (the cached YouTrack issues).
+
+    Attributes:
+        state_dir (str): Directory holding the state documents.
+    """
+
+    def __init__(self, state_dir: str = DEFAULT_STATE_DIR):
+        self.state_dir = state_dir
+
+    def path(self, name: str) -> str:
+        """Returns the file path of the document with the given name."""
+        return os.path.join(self.state_dir, f"{name}.json")
+
+    def read(self, name: str, default: Any = None) -> Any:
+        """
+        Reads a document from the state directory.
+
+        Args:
+            name (str): Document name (without extension).
+            default (Any): Value returned if the document is missing or unreadable.
+
+        Returns:
+            Any: Decoded JSON document or ``default``.
+        """
+        try:
+            with open(self.path(name), encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return default
+        except (OSError, ValueError) as e:
+            log.warning("Could not read state document '%s': %s", name, e)
+            return default
+
+    def write(self, name: str, data: Any) -> None:
+        """
+        Atomically writes a document to the state directory.
+
+        The document is written to a temporary file first and then moved
+        into place, so readers never see a partially written file.
+        """
+        os.makedirs(self.state_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, separators=(",", ":"))
+            os.replace(tmp_path, self.path(name))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def update_meta(self, **values) -> dict:
+        """Merges the given values into the small ``meta`` document."""
+        meta = self.read("meta", {})
+        meta.update(values)
+        self.write("meta", meta)
+        return meta
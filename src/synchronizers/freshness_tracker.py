@@ -0,0 +1,103 @@
+import logging
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.state.state_store import StateStore
+
+log = logging.getLogger("gh2yt.freshness")
+
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of the samples (None if there are none)."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, Optional[float]]:
+    """Returns count and p50/p95/p99 of lag samples, in seconds."""
+    summary = {"count": len(samples)}
+    for pct in (50, 95, 99):
+        value = percentile(samples, pct)
+        summary[f"p{pct}"] = round(value, 3) if value is not None else None
+    return summary
+
+
+class FreshnessTracker:
+    """
+    Measures how long GitHub edits take to reach YouTrack.
+
+    For every successful create/update, the lag between the GitHub
+    `updated_at` and the moment the YouTrack write finished is recorded.
+    Percentiles are reported per cycle and over a rolling window of the
+    most recent samples, and a warning is logged when the configured
+    percentile exceeds the freshness SLO.
+
+    The rolling window is kept in the ``freshness`` state document, so
+    one-shot and cron runs add to the same window instead of replacing it.
+
+    Attributes:
+        slo_seconds (Optional[int]): Freshness SLO in seconds (None disables the check).
+        slo_percentile (int): Percentile compared against the SLO.
+        window (deque): Most recent lag samples across cycles (bounded).
+        state (Optional[StateStore]): Store used to persist the window between runs.
+    """
+
+    def __init__(self, slo_seconds: Optional[int] = None, slo_percentile: int = 95, window_size: int = 10000,
+                 state_store: Optional[StateStore] = None):
+        self.slo_seconds = slo_seconds
+        self.slo_percentile = slo_percentile
+        self.window = deque(maxlen=window_size)
+        self.state = state_store
+        self._cycle: List[float] = []
+        self._loaded = False
+
+    def record(self, updated_at: Optional[str], since: Optional[float] = None) -> None:
+        """
+        Records the lag of a write of an issue last updated on GitHub at `updated_at`.
+
+        Args:
+            updated_at (Optional[str]): GitHub `updated_at` of the written issue.
+            since (Optional[float]): Epoch seconds at which the issue was last seen in sync.
+                Writes of issues not edited after that (drift repairs, new mappings)
+                measure nothing and are ignored.
+        """
+        if not updated_at:
+            return
+        updated = datetime.fromisoformat(updated_at.replace("Z", "+00:00")).timestamp()
+        if since is not None and updated <= since:
+            return
+        self._cycle.append(max(time.time() - updated, 0.0))
+
+    def finish_cycle(self) -> Dict[str, Dict]:
+        """
+        Closes the current cycle and returns its percentiles and the rolling ones.
+        """
+        samples, self._cycle = self._cycle, []
+        self._restore()
+        self.window.extend(samples)
+        if samples and self.state is not None:
+            self.state.write("freshness", {"samples": [round(sample, 3) for sample in self.window]})
+
+        if self.slo_seconds is not None and samples:
+            lag = percentile(samples, self.slo_percentile)
+            if lag > self.slo_seconds:
+                log.warning(
+                    "Freshness SLO breached: p%d lag %.1fs exceeds %ss",
+                    self.slo_percentile, lag, self.slo_seconds
+                )
+
+        return {"cycle": summarize(samples), "rolling": summarize(list(self.window))}
+
+    def _restore(self) -> None:
+        """Loads the persisted rolling window once, before first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.state is not None:
+            self.window.extend(self.state.read("freshness", {}).get("samples", []))
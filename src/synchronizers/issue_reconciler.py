@@ -0,0 +1,156 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+
+from src.clients.request_budget import RequestBudgetExceeded
+from src.state.state_store import StateStore
+
+log = logging.getLogger("gh2yt.reconciler")
+
+RECONCILE_ACTIONS = ("report", "tag", "close")
+
+
+class IssueReconciler:
+    """
+    Detects YouTrack issues whose GitHub source has disappeared.
+
+    The GitHub numbers seen in the last complete listing are set-diffed
+    against the numbers indexed in the YouTrack snapshot. Only the numbers
+    missing from GitHub are verified with targeted requests, so a check
+    costs one request per missing issue rather than a full re-download.
+    Only YouTrack issues carrying the GitHub import marker are considered,
+    so issues created directly in YouTrack are never touched. Numbers that
+    turn out to be pull requests are recorded once and not re-verified.
+
+    Confirmed issues are handled with the configured action:
+    - report: only log and record them
+    - tag: add a tag to the YouTrack issue
+    - close: move the YouTrack issue to the closed state
+
+    Attributes:
+        gh: GitHub client used to verify missing issues.
+        orchestrator (ServiceOrchestrator): Orchestrator holding the YouTrack snapshot.
+        state (StateStore): Local state holding known GitHub numbers and past results.
+        action (str): Action applied to confirmed issues.
+        tag (str): Tag used by the "tag" action.
+        interval (int): Minimum number of seconds between automatic runs.
+    """
+
+    def __init__(self, gh_client, service_orchestrator, state_store: Optional[StateStore] = None,
+                 action: str = "report", tag: str = "github-missing", interval: int = 86400):
+        if action not in RECONCILE_ACTIONS:
+            raise ValueError(f"Unknown reconcile action '{action}', expected one of {RECONCILE_ACTIONS}")
+        self.gh = gh_client
+        self.orchestrator = service_orchestrator
+        self.state = state_store or StateStore()
+        self.action = action
+        self.tag = tag
+        self.interval = interval
+
+    def record_listing(self, numbers: Iterable[int]) -> None:
+        """
+        Stores the GitHub numbers of a complete issue listing (state=all, no limit).
+        """
+        self.state.write("github_numbers", {
+            "listed_at": datetime.now(timezone.utc).isoformat(),
+            "numbers": sorted(numbers),
+        })
+
+    def is_due(self) -> bool:
+        """Returns True if the last reconciliation is older than the configured interval."""
+        last_run = self.state.read("reconcile", {}).get("last_run")
+        if not last_run:
+            return True
+        elapsed = datetime.now(timezone.utc) - datetime.fromisoformat(last_run)
+        return elapsed.total_seconds() >= self.interval
+
+    def reconcile(self, repo: str) -> Dict[str, str]:
+        """
+        Verifies YouTrack issues missing from the last GitHub listing.
+
+        Args:
+            repo (str): GitHub repository in the format "owner/repo".
+
+        Returns:
+            Dict[str, str]: Newly confirmed GitHub numbers mapped to their status
+            ("deleted", "transferred" or "discussion").
+        """
+        listing = self.state.read("github_numbers")
+        if not listing:
+            log.info("No complete GitHub listing recorded yet, skipping reconciliation")
+            return {}
+
+        result = self.state.read("reconcile", {})
+        handled = result.get("missing", {})
+
+        known = set(listing["numbers"])
+        candidates = sorted(
+            n for n in self.orchestrator.cached_numbers() - known
+            if str(n) not in handled
+        )
+        log.info("Reconciling %s: %d issues missing from the GitHub listing", repo, len(candidates))
+
+        confirmed = {}
+        finished = True
+        try:
+            for number in candidates:
+                yt_issue = self.orchestrator.get_cached_issue(number)
+                if not yt_issue:
+                    continue
+                status = self._verify(repo, number)
+                if status is None:
+                    continue
+                if status == "pull_request":
+                    # Pull requests are never listed as issues; remember them instead of re-checking every run
+                    log.info("GH #%s is a pull request, skipping (YouTrack ID-%s)", number, yt_issue.get("id"))
+                    handled[str(number)] = status
+                    continue
+                if self._handle(number, yt_issue, status):
+                    confirmed[str(number)] = status
+        except RequestBudgetExceeded:
+            # Unverified candidates are picked up by the next run, which stays due
+            log.warning("Request budget reached, stopping reconciliation early")
+            finished = False
+
+        handled.update(confirmed)
+        self.state.write("reconcile", {
+            "last_run": datetime.now(timezone.utc).isoformat() if finished else result.get("last_run"),
+            "action": self.action,
+            "missing": handled,
+        })
+        log.info("Reconciliation finished: %d newly missing, %d in total", len(confirmed), len(handled))
+        return confirmed
+
+    def _verify(self, repo: str, number: int) -> Optional[str]:
+        """
+        Checks a single number on GitHub. Returns None if the issue still belongs to the repo,
+        "pull_request" if the number is a pull request, or the reason it is missing.
+        """
+        try:
+            issue = self.gh.fetch_issue(repo, number)
+        except RequestBudgetExceeded:
+            raise
+        except Exception as e:
+            log.error("Error verifying GH #%s: %s", number, e)
+            return None
+
+        if issue is None:
+            return "deleted"
+        if "pull_request" in issue:
+            return "pull_request"
+        if "/discussions/" in (issue.get("html_url") or ""):
+            return "discussion"
+        if not (issue.get("repository_url") or "").endswith(f"/repos/{repo}"):
+            return "transferred"
+        return None
+
+    def _handle(self, number: int, yt_issue: Optional[dict], status: str) -> bool:
+        """Applies the configured action to a confirmed issue."""
+        yt_id = yt_issue.get("id") if yt_issue else None
+        log.warning("GH #%s is %s on GitHub (YouTrack ID-%s, action=%s)", number, status, yt_id, self.action)
+
+        if self.action == "report" or not yt_id:
+            return True
+        if self.action == "tag":
+            return self.orchestrator.tag_issue(yt_id, self.tag)
+        return self.orchestrator.close_issue(yt_id) is not None
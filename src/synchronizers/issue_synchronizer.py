@@ -1,25 +1,86 @@
 import pprint
 import time
 import logging
-from typing import Optional
+from datetime import datetime, timezone
+from typing import List, Optional
+from src.clients.request_budget import RequestBudget, RequestBudgetExceeded
+from src.logging_config import PER_ISSUE, dropped_log_records
 from src.services.issue_service import IssueService
+from src.state.state_store import StateStore
+from src.synchronizers.freshness_tracker import FreshnessTracker
+from src.synchronizers.issue_reconciler import IssueReconciler
+from src.synchronizers.migration_planner import MigrationPlanner
+from src.synchronizers.request_estimator import ISSUE_WRITE_COST
+from src.synchronizers.tier_scheduler import TierScheduler
 
 log = logging.getLogger("gh2yt.synchronizer")
 
 
+def parse_issue_numbers(spec: str) -> List[int]:
+    """
+    Parses a list of issue numbers and ranges such as "12,40-55".
+
+    Returns:
+        List[int]: Sorted, distinct issue numbers.
+    """
+    numbers = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(bound) for bound in part.split("-", 1))
+            if start > end:
+                raise ValueError(f"Invalid issue range '{part}'")
+            numbers.update(range(start, end + 1))
+        else:
+            numbers.add(int(part))
+    return sorted(numbers)
+
+
 class IssueSynchronizer:
     """
     Responsible for synchronizing issues between GitHub and YouTrack.
 
     This class periodically fetches issues from a GitHub repository and
     synchronizes them with a target YouTrack project using the provided
-    orchestrator service.
+    orchestrator service. If a reconciler is given, YouTrack issues whose
+    GitHub source disappeared are detected whenever a reconciliation is due.
+    If a scheduler is given, continuous syncs only check the issues whose
+    recency tier is due in the current cycle.
+
+    When the target project is empty, issues are bulk-created concurrently
+    through the MigrationPlanner instead of being synchronized one by one.
+    An explicit initial import skips loading the snapshot, but only after
+    a `$top=1` query confirms that the project has no issues.
+
+    The freshness tracker records the lag between each GitHub edit and
+    the YouTrack write that applied it; writes of issues not edited since
+    their last check are not counted.
+
+    The request budget is shared with the clients. It is checked before
+    every issue write; once the next write no longer fits, the cycle is
+    finished cleanly (snapshot, schedule and journal are saved) and the
+    run stops, so a later run resumes where this one left off.
     """
-    def __init__(self, gh_client, service_orchestrator):
+    def __init__(self, gh_client, service_orchestrator, state_store: Optional[StateStore] = None,
+                 reconciler: Optional[IssueReconciler] = None, scheduler: Optional[TierScheduler] = None,
+                 workers: int = 8, batch_size: int = 50, freshness: Optional[FreshnessTracker] = None,
+                 budget: Optional[RequestBudget] = None):
         self.gh = gh_client
         self.orchestrator = service_orchestrator
+        self.state = state_store or StateStore()
+        self.budget = budget or RequestBudget()
+        self.planner = MigrationPlanner(gh_client, service_orchestrator, self.state, budget=self.budget)
+        self.reconciler = reconciler
+        self.scheduler = scheduler
+        self.workers = workers
+        self.batch_size = batch_size
+        self.freshness = freshness or FreshnessTracker()
+        self._log_dropped = dropped_log_records()
 
-    def sync(self, repo: str, state: Optional[str] = "all", interval: int = 60, once: bool = False, dry_run: bool = False, limit: Optional[int] = None):
+    def sync(self, repo: str, state: Optional[str] = "all", interval: int = 60, once: bool = False, dry_run: bool = False, limit: Optional[int] = None,
+             initial_import: bool = False):
         """
         Synchronizes issues from GitHub to YouTrack.
 
@@ -31,8 +92,10 @@ class IssueSynchronizer:
             state (Optional[str]): Issue state to fetch ("all", "open", "closed").
             interval (int): Time interval between syncs (in seconds).
             once (bool): If True, performs a single synchronization and exits.
-            dry_run (bool): If True, logs what would happen without making changes.
+            dry_run (bool): If True, logs the plan of changes without making them.
             limit (Optional[int]): Maximum number of issues to fetch.
+            initial_import (bool): If True, the first cycle skips loading existing
+                YouTrack issues and bulk-creates all fetched issues.
 
         Returns:
             None
@@ -41,46 +104,256 @@ class IssueSynchronizer:
             try:
                 issues = self.gh.fetch_issues(repo, state=state)
                 # pprint.pprint(issues)
+                if self.reconciler and state == "all" and not limit:
+                    self.reconciler.record_listing(issue["number"] for issue in issues)
                 if limit:
                     issues = issues[:limit]
 
                 log.info("Fetched %d issues from GitHub (state=%s)", len(issues), state)
-                for issue in issues:
-                    if dry_run:
-                        payload = self.orchestrator.map_issue_create(issue)
-                        log.info("[dry-run] GH #%s → %s", issue.get("number"), payload.get("summary"))
-                        continue
-
-                    self._sync_issue(issue)
+                if dry_run:
+                    plan = self.planner.build_plan(issues, repo=repo)
+                    for entry in plan["entries"]:
+                        log.info("[dry-run] GH #%s → %s %s", entry["number"], entry["op"], sorted(entry["payload"]), extra=PER_ISSUE)
+                    log.info("[dry-run] Plan summary: %s", plan["summary"])
+                else:
+                    stats = self._run_cycle(repo, issues, cycle_interval=None if once else interval, initial_import=initial_import)
+                    initial_import = False
+                    if stats.get("budget_exhausted"):
+                        log.warning("Request budget of %s requests reached, stopping sync.", self.budget.max_requests)
+                        return
 
                 if once:
                     log.info("One-time sync completed.")
                     return
 
-                log.info(f"Sleeping {interval} seconds before next sync...")
+                issues = None  # release the cycle buffer while sleeping
+                log.info("Sleeping %s seconds before next sync...", interval)
                 time.sleep(interval)
 
             except KeyboardInterrupt:
                 log.info("Synchronization interrupted by user.")
                 break
+            except RequestBudgetExceeded as e:
+                log.warning("%s, stopping sync.", e)
+                return
             except Exception as e:
-                log.exception(f"Error during sync: {e}")
+                log.exception("Error during sync: %s", e)
                 time.sleep(interval)
 
-    def _sync_issue(self, issue: dict):
+    def sync_numbers(self, repo: str, numbers: List[int]) -> dict:
         """
-        Synchronizes a single issue.
+        Synchronizes only the given GitHub issue numbers.
+
+        Each issue is fetched directly (concurrently) instead of listing the
+        whole repository, then goes through the normal orchestrator path.
+
+        Args:
+            repo (str): GitHub repository in the format "owner/repo".
+            numbers (List[int]): GitHub issue numbers to synchronize.
+
+        Returns:
+            dict: Counts of missing (deleted, transferred or pull requests), created,
+                updated, unchanged and failed issues (plus "budget_exhausted"
+                if the budget stopped the sync early).
+        """
+        issues, failed = self.gh.fetch_issues_by_number(repo, numbers)
+        missing = sorted(set(numbers) - set(failed) - {issue["number"] for issue in issues})
+        if missing:
+            log.warning("Issues not found on GitHub (deleted, transferred or pull requests): %s", missing)
+
+        stats = {
+            "requested": len(numbers), "missing": len(missing),
+            "created": 0, "updated": 0, "noop": 0, "failed": len(failed),
+        }
+        self.orchestrator.refresh_snapshot()
+        try:
+            self.orchestrator.prepare_assignees(self.orchestrator.collect_assignees(issues))
+            for issue in issues:
+                if not self._budget_allows(stats):
+                    break
+                stats[self._sync_issue(issue)] += 1
+        except RequestBudgetExceeded:
+            self._budget_reached(stats)
+        self.orchestrator.save_snapshot()
+
+        log.info("Targeted sync of %d issues finished: %s", len(numbers), stats)
+        return stats
+
+    def _run_cycle(self, repo: str, issues: list, cycle_interval: Optional[int] = None, initial_import: bool = False):
+        """
+        Runs one synchronization cycle over the fetched issues and records
+        its statistics in the local state, where `status` can read them.
+
+        In continuous mode (`cycle_interval` set) the scheduler, if any,
+        limits the cycle to the issues whose tier is due.
 
-        Determines whether the issue already exists in YouTrack and
-        updates it if necessary, or creates a new one.
+        Returns:
+            dict: The cycle statistics.
         """
-        github_issue_number = issue.get("number")
-        yt_id = self.orchestrator.find_existing_issue_id(github_issue_number)
+        started = time.monotonic()
+        stats = {"fetched": len(issues), "skipped": 0, "created": 0, "updated": 0, "noop": 0, "failed": 0}
+
+        if initial_import and self.orchestrator.project_has_issues() is not False:
+            log.warning(
+                "Project %s is not empty (or could not be checked), ignoring initial import",
+                self.orchestrator.project_short
+            )
+            initial_import = False
 
-        if yt_id:
-            current = self.orchestrator.get_issue(yt_id)
-            self.orchestrator.update_issue(current, issue, yt_id)
+        if not initial_import:
+            self.orchestrator.refresh_snapshot()
+            initial_import = len(self.orchestrator.snapshot_service) == 0
+
+        if initial_import:
+            checked = self._bulk_import(repo, issues, stats)
         else:
-            res = self.orchestrator.create_issue(issue)
-            if res:
-                log.info(f"Created issue with ID-{res['id']}")
\ No newline at end of file
+            checked = self._sync_due(issues, stats, cycle_interval)
+
+        if self.scheduler:
+            self.scheduler.mark_checked(checked)
+
+        if self.reconciler and self.reconciler.is_due():
+            self.reconciler.reconcile(repo)
+
+        freshness = self.freshness.finish_cycle()
+        stats["freshness"] = freshness["cycle"]
+        stats["duration"] = round(time.monotonic() - started, 3)
+        dropped = dropped_log_records()
+        if dropped > self._log_dropped:
+            stats["log_dropped"] = dropped - self._log_dropped
+            self._log_dropped = dropped
+            log.warning("%d log records below WARNING were dropped (log queue full)", stats["log_dropped"])
+        meta = self.state.read("meta", {})
+        # Only issues actually checked count; skipped, failed and unreached issues are still pending
+        checked_numbers = set(checked)
+        watermark = max(
+            [issue["updated_at"] for issue in issues if issue.get("updated_at") and issue["number"] in checked_numbers]
+            + [meta.get("watermark") or ""]
+        )
+        self.state.update_meta(
+            repo=repo,
+            last_sync=datetime.now(timezone.utc).isoformat(),
+            watermark=watermark or None,
+            last_cycle=stats,
+            freshness_rolling=freshness["rolling"],
+        )
+        log.info("Sync cycle finished: %s", stats)
+        return stats
+
+    def _bulk_import(self, repo: str, issues: list, stats: dict) -> list:
+        """
+        Cold-start path for an empty project: skips existence checks, provisions
+        all assignees up front and creates the issues concurrently in number order.
+        Freshness lag is not recorded here, as it would measure the migration
+        backlog rather than sync latency.
+
+        Returns:
+            list: GitHub numbers of the issues that were created.
+        """
+        log.info("Initial import of %d issues into empty project %s", len(issues), self.orchestrator.project_short)
+        ordered = sorted(issues, key=lambda issue: issue["number"])
+        plan = self.planner.build_plan(ordered, repo=repo, refresh=False)
+        # The project was confirmed empty (or the snapshot just loaded empty), so there is nothing to refresh
+        result = self.planner.apply(
+            plan, workers=self.workers, batch_size=self.batch_size, journal_name="import_journal", refresh=False
+        )
+
+        stats["noop"] += plan["summary"]["noop"]
+        for key in ("created", "updated", "failed"):
+            stats[key] += result[key]
+        if result.get("budget_exhausted"):
+            stats["budget_exhausted"] = True
+        return self.state.read("import_journal", {}).get("done", [])
+
+    def _sync_due(self, issues: list, stats: dict, cycle_interval: Optional[int]) -> list:
+        """
+        Incremental path: synchronizes the issues due in this cycle one by one.
+
+        Returns:
+            list: GitHub numbers of the issues that were checked successfully.
+        """
+        due = issues
+        if self.scheduler and cycle_interval:
+            due = self.scheduler.select(issues, cycle_interval)
+            stats["skipped"] = len(issues) - len(due)
+
+        # Provision assignees only for issues that are going to be written
+        pending = []
+        checked = []
+        for issue in due:
+            current = self.orchestrator.get_cached_issue(issue.get("number"))
+            if current and not self.orchestrator.needs_update(current, issue):
+                stats["noop"] += 1
+                checked.append(issue["number"])
+            else:
+                pending.append(issue)
+        last_sync = self.state.read("meta", {}).get("last_sync")
+        last_sync = datetime.fromisoformat(last_sync).timestamp() if last_sync else float("inf")
+        assignees = self.orchestrator.collect_assignees(pending)
+        # Kept with the cycle stats for the request estimator
+        stats["assignees"] = len(assignees)
+        try:
+            self.orchestrator.prepare_assignees(assignees)
+            for issue in pending:
+                if not self._budget_allows(stats):
+                    break
+                outcome = self._sync_issue(issue)
+                stats[outcome] += 1
+                if outcome != "failed":
+                    checked.append(issue["number"])
+                    self.freshness.record(issue.get("updated_at"), since=self._last_seen(issue["number"], last_sync))
+        except RequestBudgetExceeded:
+            # A write ran out of budget midway; everything done so far is still saved
+            self._budget_reached(stats)
+        self.orchestrator.save_snapshot()
+        return checked
+
+    def _last_seen(self, number: int, last_sync: float) -> float:
+        """
+        Epoch seconds at which an issue was last known to be in sync: its last
+        successful check, or the previous sync for issues never checked
+        (infinity on the first sync, whose writes are all backfill).
+        """
+        last_checked = self.scheduler.last_checked(number) if self.scheduler else 0.0
+        return last_checked or last_sync
+
+    def _budget_allows(self, stats: dict) -> bool:
+        """Checkpoint before an issue write; flags the stats once the budget cannot cover it."""
+        if self.budget.can_afford(ISSUE_WRITE_COST):
+            return True
+        self._budget_reached(stats)
+        return False
+
+    def _budget_reached(self, stats: dict) -> None:
+        """Flags the stats of a cycle stopped by the request budget."""
+        if not stats.get("budget_exhausted"):
+            stats["budget_exhausted"] = True
+            log.warning("Request budget reached (%d requests used), stopping before the next issue", self.budget.used)
+
+    def _sync_issue(self, issue: dict) -> str:
+        """
+        Synchronizes a single issue.
+
+        Looks the issue up in the YouTrack snapshot and updates it if
+        necessary, or creates a new one.
+
+        Returns:
+            str: Outcome of the sync ("created", "updated", "noop" or "failed").
+        """
+        current = self.orchestrator.get_cached_issue(issue.get("number"))
+
+        if current:
+            # Compared with the validated assignee: clearing an unusable one may leave nothing to write
+            if not self.orchestrator.needs_update(current, issue, validate=True):
+                return "noop"
+            res = self.orchestrator.update_issue(current, issue, current["id"])
+            if not res:
+                return "failed"
+            # An issue deleted in YouTrack is created again under a new ID
+            return "updated" if res.get("id") == current["id"] else "created"
+
+        res = self.orchestrator.create_issue(issue)
+        if res:
+            log.info("Created issue with ID-%s", res['id'], extra=PER_ISSUE)
+            return "created"
+        return "failed"
\ No newline at end of file
@@ -0,0 +1,244 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from src.clients.request_budget import RequestBudget, RequestBudgetExceeded
+from src.state.state_store import StateStore
+from src.synchronizers.request_estimator import ISSUE_WRITE_COST
+
+log = logging.getLogger("gh2yt.planner")
+
+PLAN_VERSION = 1
+
+
+def save_plan(plan: dict, path: str) -> None:
+    """Writes a plan to disk in compact JSON form."""
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(plan, fh, separators=(",", ":"))
+
+
+def load_plan(path: str) -> dict:
+    """Reads a plan previously written by `save_plan`."""
+    with open(path, encoding="utf-8") as fh:
+        plan = json.load(fh)
+    if plan.get("version") != PLAN_VERSION:
+        raise ValueError(f"Unsupported plan version: {plan.get('version')}")
+    return plan
+
+
+class MigrationPlanner:
+    """
+    Computes and applies offline migration plans.
+
+    Planning compares GitHub issues with the local YouTrack snapshot
+    and records the resulting create/update operations without writing
+    anything to YouTrack. Applying executes a previously computed plan in
+    batches using a pool of worker threads, keeping a journal so that an
+    interrupted apply can be resumed.
+
+    Attributes:
+        gh: GitHub client used to fetch issues.
+        orchestrator (ServiceOrchestrator): Orchestrator used for mapping and writes.
+        state (StateStore): Local state holding the apply journal.
+        budget (RequestBudget): Per-run request budget checked between batches.
+    """
+
+    def __init__(self, gh_client, service_orchestrator, state_store: Optional[StateStore] = None,
+                 budget: Optional[RequestBudget] = None):
+        self.gh = gh_client
+        self.orchestrator = service_orchestrator
+        self.state = state_store or StateStore()
+        self.budget = budget or RequestBudget()
+
+    def plan(self, repo: str, state: Optional[str] = "all", limit: Optional[int] = None) -> dict:
+        """
+        Fetches issues from GitHub and builds a plan for them.
+
+        Args:
+            repo (str): GitHub repository in the format "owner/repo".
+            state (Optional[str]): Issue state to fetch ("all", "open", "closed").
+            limit (Optional[int]): Maximum number of issues to plan.
+
+        Returns:
+            dict: The computed plan.
+        """
+        issues = self.gh.fetch_issues(repo, state=state)
+        if limit:
+            issues = issues[:limit]
+        log.info("Fetched %d issues from GitHub (state=%s)", len(issues), state)
+        return self.build_plan(issues, repo=repo)
+
+    def build_plan(self, issues: List[Dict], repo: Optional[str] = None, refresh: bool = True) -> dict:
+        """
+        Builds a create/update/no-op plan for the given GitHub issues.
+
+        YouTrack issues are taken from the project snapshot, which is
+        refreshed incrementally before diffing unless `refresh` is False.
+        """
+        if refresh:
+            self.orchestrator.refresh_snapshot()
+        summary = {"create": 0, "update": 0, "noop": 0}
+        entries = []
+
+        for issue in issues:
+            number = issue.get("number")
+            current = self.orchestrator.get_cached_issue(number)
+
+            if current is None:
+                entry = {"op": "create", "number": number, "payload": self.orchestrator.map_create(issue)}
+            else:
+                payload = self.orchestrator.map_update(current, issue)
+                if not payload:
+                    summary["noop"] += 1
+                    continue
+                entry = {"op": "update", "number": number, "yt_id": current.get("id"), "payload": payload}
+
+            assignee = issue.get("assignee")
+            if assignee and assignee.get("login"):
+                entry["assignee"] = {"login": assignee.get("login"), "name": assignee.get("name")}
+
+            summary[entry["op"]] += 1
+            entries.append(entry)
+
+        self.orchestrator.save_snapshot()
+
+        return {
+            "version": PLAN_VERSION,
+            "id": datetime.now(timezone.utc).isoformat(),
+            "repo": repo,
+            "project": self.orchestrator.project_short,
+            "project_id": self.orchestrator.project_id,
+            "summary": summary,
+            "entries": entries,
+        }
+
+    def apply(self, plan: dict, workers: int = 8, batch_size: int = 50, journal_name: str = "journal",
+              refresh: bool = True) -> dict:
+        """
+        Executes a plan in concurrent batches.
+
+        Progress, including the YouTrack ID of every written issue, is
+        written to the `journal_name` state document after every batch, so
+        re-running the same plan skips entries already applied. The snapshot
+        is refreshed first, and create entries whose issue already exists
+        (e.g. created by a sync since planning, or with the journal lost)
+        are skipped instead of creating duplicates.
+
+        Args:
+            plan (dict): Plan produced by `build_plan`.
+            workers (int): Number of concurrent YouTrack writers.
+            batch_size (int): Number of entries applied between checkpoints.
+                The request budget is checked before every batch; if the next
+                batch does not fit, apply stops and can be resumed later.
+            journal_name (str): State document holding the progress journal.
+            refresh (bool): Refresh the snapshot before applying; only skipped
+                when the project was just confirmed to be empty.
+
+        Returns:
+            dict: Counts of created, updated, skipped and failed entries.
+        """
+        journal = self.state.read(journal_name, {})
+        if journal.get("plan_id") != plan["id"]:
+            journal = {"plan_id": plan["id"], "total": len(plan["entries"]), "done": [], "ids": {}}
+
+        stats = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+        try:
+            if refresh:
+                self.orchestrator.refresh_snapshot()
+        except RequestBudgetExceeded:
+            log.warning("Request budget reached before applying plan %s; re-run apply to resume", plan["id"])
+            return dict(stats, budget_exhausted=True)
+
+        done = set(journal["done"])
+        pending = []
+        for entry in plan["entries"]:
+            if entry["number"] in done:
+                continue
+            existing = self.orchestrator.get_cached_issue(entry["number"]) if entry["op"] == "create" else None
+            if existing:
+                stats["skipped"] += 1
+                journal["done"].append(entry["number"])
+                journal.setdefault("ids", {})[str(entry["number"])] = existing.get("id")
+                continue
+            pending.append(entry)
+        if stats["skipped"]:
+            log.warning("Skipping %d create entries whose issues already exist in YouTrack", stats["skipped"])
+            self.state.write(journal_name, journal)
+        log.info("Applying plan %s: %d of %d entries pending", plan["id"], len(pending), journal["total"])
+
+        try:
+            assignees = self.orchestrator.prepare_assignees(
+                {e["assignee"]["login"]: e["assignee"].get("name") for e in pending if e.get("assignee")}
+            )
+        except RequestBudgetExceeded:
+            pending, stats["budget_exhausted"] = [], True
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                try:
+                    self._prepare_assignees(batch, assignees)
+                except RequestBudgetExceeded:
+                    stats["budget_exhausted"] = True
+                if stats.get("budget_exhausted") or not self.budget.can_afford(len(batch) * ISSUE_WRITE_COST):
+                    stats["budget_exhausted"] = True
+                    break
+
+                futures = [pool.submit(self._apply_entry, entry) for entry in batch]
+                for entry, future in zip(batch, futures):
+                    try:
+                        result = future.result()
+                    except RequestBudgetExceeded:
+                        # Not applied; stays pending in the journal
+                        stats["budget_exhausted"] = True
+                        continue
+                    if not result:
+                        stats["failed"] += 1
+                        continue
+                    stats["created" if entry["op"] == "create" else "updated"] += 1
+                    journal["done"].append(entry["number"])
+                    journal.setdefault("ids", {})[str(entry["number"])] = result.get("id")
+
+                self.state.write(journal_name, journal)
+                log.info("Applied %d/%d entries", len(journal["done"]), journal["total"])
+                if stats.get("budget_exhausted"):
+                    break
+
+        if stats.get("budget_exhausted"):
+            log.warning(
+                "Request budget reached after %d/%d entries, stopping; re-run apply to resume",
+                len(journal["done"]), journal["total"]
+            )
+        self.orchestrator.save_snapshot()
+        log.info("Plan applied: %s", stats)
+        return stats
+
+    def _prepare_assignees(self, batch: List[dict], known: Dict[str, Optional[bool]]) -> None:
+        """
+        Drops assignees that failed validation in the pre-pass from the batch payloads.
+        Unknown assignees (None) are dropped too, which leaves the assignee of an
+        existing issue unchanged.
+        """
+        for entry in batch:
+            assignee = entry.get("assignee")
+            if not assignee:
+                continue
+            login = assignee["login"]
+            if login not in known:
+                known[login] = self.orchestrator.ensure_assignee(login, assignee.get("name"))
+            if not known[login]:
+                fields = entry["payload"].get("customFields", [])
+                entry["payload"]["customFields"] = [cf for cf in fields if cf.get("name") != "Assignee"]
+
+    def _apply_entry(self, entry: dict) -> Optional[dict]:
+        """Writes a single plan entry to YouTrack."""
+        payload = entry["payload"]
+        if entry["op"] == "create":
+            return self.orchestrator.submit_create(payload)
+        if not payload.get("customFields"):
+            payload.pop("customFields", None)
+        if not payload:
+            return {"id": entry["yt_id"]}
+        return self.orchestrator.submit_update(entry["yt_id"], payload)
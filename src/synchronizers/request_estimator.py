@@ -0,0 +1,135 @@
+import math
+from typing import Dict, Optional
+
+from src.state.state_store import StateStore
+
+GITHUB_PAGE_SIZE = 100
+YOUTRACK_PAGE_SIZE = 500
+# Requests one issue write can need once its assignee is provisioned (write + field value creation)
+ISSUE_WRITE_COST = 2
+
+
+def estimate_requests(issue_count: int, mapped_issues: int = 0, snapshot_loaded: bool = False,
+                      due_fraction: float = 1.0, update_rate: float = 1.0, distinct_assignees: int = 0,
+                      creates: Optional[int] = None, updates: Optional[int] = None,
+                      planned: bool = False) -> Dict[str, Dict[str, int]]:
+    """
+    Predicts the API requests a sync run will make, per phase.
+
+    GitHub issues without a YouTrack counterpart are predicted as creates.
+    Of the mapped issues, the share due this cycle (`due_fraction`) is diffed
+    against the snapshot and the share that changed (`update_rate`) is
+    predicted as updates. Nothing is requested from GitHub or YouTrack.
+
+    Args:
+        issue_count (int): Number of GitHub issues the run will process.
+        mapped_issues (int): Issues already present in the YouTrack snapshot.
+        snapshot_loaded (bool): Whether a persisted snapshot exists (incremental refresh).
+        due_fraction (float): Share of the mapped issues checked this cycle (tier schedule).
+        update_rate (float): Share of the checked issues that needs an update.
+        distinct_assignees (int): Distinct assignee logins of the issues to write.
+        creates (Optional[int]): Known number of creates (e.g. from a plan).
+        updates (Optional[int]): Known number of updates (e.g. from a plan).
+        planned (bool): The issues come from a plan file, which `apply`
+            executes without fetching from GitHub or refreshing the snapshot.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Requests per phase for "github" and "youtrack",
+        the "predicted" workload behind them, and the "total".
+    """
+    mapped_in_run = min(issue_count, mapped_issues)
+    due = mapped_in_run if planned else math.ceil(mapped_in_run * due_fraction)
+    if creates is None:
+        creates = issue_count - mapped_in_run
+    if updates is None:
+        updates = math.ceil(due * update_rate)
+    writes = creates + updates
+
+    github = {
+        "fetch": 0 if planned else max(math.ceil(issue_count / GITHUB_PAGE_SIZE), 1),
+    }
+
+    if planned:
+        lookup = 0
+    elif snapshot_loaded:
+        # Incremental refreshes only return recently updated issues and usually fit one page
+        lookup = 1
+    else:
+        lookup = max(math.ceil(mapped_issues / YOUTRACK_PAGE_SIZE), 1)
+
+    youtrack = {
+        "lookup": lookup,
+        # Issues are diffed against the snapshot, so only the version and tag indexes are read
+        "get": (1 if due or creates else 0) + (1 if writes else 0),
+        # users listing + project ringId + team listing, then create + add per assignee at most
+        "user_team": 3 + 2 * distinct_assignees if writes else 0,
+        "write": writes,
+    }
+
+    return {
+        "github": github,
+        "youtrack": youtrack,
+        "predicted": {
+            "issues": issue_count,
+            "due": due,
+            "creates": creates,
+            "updates": updates,
+            "assignees": distinct_assignees,
+        },
+        "total": {"requests": sum(github.values()) + sum(youtrack.values())},
+    }
+
+
+def estimate_from_state(state_store: StateStore, plan: Optional[dict] = None,
+                        issue_count: Optional[int] = None, continuous: bool = False) -> Dict[str, Dict[str, int]]:
+    """
+    Estimates the next run from local state only.
+
+    The issue count comes from `issue_count`, the plan, the last complete
+    GitHub listing or the last cycle, in that order. A plan provides the
+    exact creates, updates and assignees. Otherwise they are derived from
+    the snapshot (mapped vs. unmapped issues) and the last cycle: its share
+    of updated vs. unchanged issues, its distinct assignees and, for
+    continuous syncs, the share of issues the tier schedule left due.
+
+    Args:
+        state_store (StateStore): Local state of previous runs.
+        plan (Optional[dict]): Plan to be applied, if any.
+        issue_count (Optional[int]): Overrides the number of GitHub issues.
+        continuous (bool): Estimate a cycle of continuous sync (tiers apply)
+            rather than a one-time run that checks every issue.
+    """
+    meta = state_store.read("meta", {})
+    last_cycle = meta.get("last_cycle") or {}
+    mapped_issues = meta.get("mapped_issues", 0)
+
+    if plan is not None:
+        entries = plan["entries"]
+        creates = sum(1 for entry in entries if entry["op"] == "create")
+        return estimate_requests(
+            issue_count or len(entries),
+            mapped_issues=len(entries) - creates,
+            distinct_assignees=len({entry["assignee"]["login"] for entry in entries if entry.get("assignee")}),
+            creates=creates,
+            updates=len(entries) - creates,
+            planned=True,
+        )
+
+    if issue_count is None:
+        listing = state_store.read("github_numbers", {})
+        issue_count = len(listing.get("numbers", [])) or last_cycle.get("fetched", 0)
+
+    checked = last_cycle.get("updated", 0) + last_cycle.get("noop", 0)
+    update_rate = last_cycle.get("updated", 0) / checked if checked else 1.0
+    due_fraction = 1.0
+    if continuous and last_cycle.get("fetched"):
+        due_fraction = 1 - last_cycle.get("skipped", 0) / last_cycle["fetched"]
+
+    return estimate_requests(
+        issue_count,
+        mapped_issues=mapped_issues,
+        snapshot_loaded=bool(meta.get("snapshot_refreshed_at")),
+        due_fraction=due_fraction,
+        update_rate=update_rate,
+        distinct_assignees=last_cycle.get("assignees", 0),
+    )
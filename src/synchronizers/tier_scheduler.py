@@ -0,0 +1,100 @@
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.state.state_store import StateStore
+
+log = logging.getLogger("gh2yt.scheduler")
+
+
+def _timestamp(value: Optional[str]) -> float:
+    """Converts a GitHub ISO timestamp (e.g. 2024-01-01T10:00:00Z) to epoch seconds."""
+    if not value:
+        return 0.0
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class TierScheduler:
+    """
+    Decides which issues are checked in a sync cycle, based on recency.
+
+    Issues are sorted into tiers by their GitHub `updated_at`:
+    - hot: updated within `hot_age` seconds, checked every cycle
+    - warm: updated within `warm_age` seconds, checked every `warm_interval` seconds
+    - cold: everything older, checked by a slow sweep that covers all cold
+      issues once per `cold_interval` seconds, oldest check first
+
+    Issues that were never checked are always due. Check times are kept in
+    the ``checked`` state document so restarts keep the schedule.
+
+    Attributes:
+        hot_age (int): Maximum age in seconds of a hot issue.
+        warm_age (int): Maximum age in seconds of a warm issue.
+        warm_interval (int): Seconds between checks of a warm issue.
+        cold_interval (int): Seconds in which the sweep covers all cold issues.
+        state (StateStore): Local state holding the last check time of each issue.
+    """
+
+    def __init__(self, hot_age: int, warm_age: int, warm_interval: int, cold_interval: int,
+                 state_store: Optional[StateStore] = None):
+        self.hot_age = hot_age
+        self.warm_age = warm_age
+        self.warm_interval = warm_interval
+        self.cold_interval = cold_interval
+        self.state = state_store or StateStore()
+        self.checked: Optional[Dict[str, float]] = None
+
+    def select(self, issues: List[dict], cycle_interval: int) -> List[dict]:
+        """
+        Returns the issues due in this cycle.
+
+        Args:
+            issues (List[dict]): All fetched GitHub issues.
+            cycle_interval (int): Seconds between sync cycles, used to size the cold sweep.
+        """
+        if self.checked is None:
+            self.checked = self.state.read("checked", {})
+
+        now = time.time()
+        hot, warm, cold = [], [], []
+        for issue in issues:
+            age = now - _timestamp(issue.get("updated_at"))
+            if age < self.hot_age:
+                hot.append(issue)
+            elif age < self.warm_age:
+                warm.append(issue)
+            else:
+                cold.append(issue)
+
+        def last_checked(issue: dict) -> float:
+            return self.checked.get(str(issue.get("number")), 0.0)
+
+        due = hot + [issue for issue in warm if now - last_checked(issue) >= self.warm_interval]
+
+        never_checked = [issue for issue in cold if last_checked(issue) == 0.0]
+        checked_cold = sorted((issue for issue in cold if last_checked(issue) > 0.0), key=last_checked)
+        quota = math.ceil(len(cold) * cycle_interval / self.cold_interval) if self.cold_interval else len(cold)
+        due += never_checked + checked_cold[:max(quota - len(never_checked), 0)]
+
+        log.info(
+            "Tiers: hot=%d warm=%d cold=%d -> %d due this cycle",
+            len(hot), len(warm), len(cold), len(due)
+        )
+        return due
+
+    def last_checked(self, number: int) -> float:
+        """Returns the epoch seconds of the last successful check of an issue (0.0 if never)."""
+        if self.checked is None:
+            self.checked = self.state.read("checked", {})
+        return self.checked.get(str(number), 0.0)
+
+    def mark_checked(self, numbers: Iterable[int]) -> None:
+        """Records that the given issues were checked now and persists the schedule."""
+        if self.checked is None:
+            self.checked = self.state.read("checked", {})
+        now = time.time()
+        for number in numbers:
+            self.checked[str(number)] = now
+        self.state.write("checked", self.checked)
@@ -0,0 +1,189 @@
+import logging
+import os
+import tempfile
+import tracemalloc
+import unittest
+from datetime import datetime, timezone
+
+from src.services.service_orchestrator import ServiceOrchestrator
+from src.state.state_store import StateStore
+from src.synchronizers.freshness_tracker import FreshnessTracker
+from src.synchronizers.issue_synchronizer import IssueSynchronizer
+from src.synchronizers.tier_scheduler import TierScheduler
+
+CYCLES = int(os.getenv("SOAK_CYCLES", "2000"))
+WARMUP_CYCLES = 200
+ISSUES = 50
+# Edits rotate over the first ACTIVE_ISSUES issues (hot tier); the rest stays cold
+ACTIVE_ISSUES = 10
+EDITS_PER_CYCLE = 2
+# Allowed heap growth between the end of warm-up and the last cycle
+MAX_GROWTH_BYTES = 512 * 1024
+
+
+class FakeGitHub:
+    """
+    Repository of ISSUES issues where a few active issues are edited every cycle.
+
+    Labels, milestones and assignees rotate over small sets, so every write
+    path is exercised without the data itself growing. After `cycles` listings
+    it raises KeyboardInterrupt, which ends `IssueSynchronizer.sync`.
+    """
+
+    def __init__(self, cycles: int, on_cycle=None):
+        self.cycles = cycles
+        self.on_cycle = on_cycle
+        self.cycle = 0
+        self.issues = [self._issue(number, 0, "2024-01-01T00:00:00Z") for number in range(1, ISSUES + 1)]
+
+    @staticmethod
+    def _issue(number: int, revision: int, updated_at: str = None) -> dict:
+        return {
+            "number": number,
+            "title": f"Issue {number} rev {revision % 7}",
+            "body": f"Body of issue {number}",
+            "state": "open" if revision % 3 else "closed",
+            "html_url": f"https://github.com/owner/repo/issues/{number}",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": updated_at or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "assignee": {"login": f"user{revision % 4}"},
+            "labels": [{"name": f"label{(number + revision) % 6}"}],
+            "milestone": {"title": f"v{revision % 3}"},
+        }
+
+    def fetch_issues(self, repo: str, state: str = "all") -> list:
+        if self.on_cycle:
+            self.on_cycle(self.cycle)
+        if self.cycle >= self.cycles:
+            raise KeyboardInterrupt
+        for offset in range(EDITS_PER_CYCLE):
+            index = (self.cycle * EDITS_PER_CYCLE + offset) % ACTIVE_ISSUES
+            self.issues[index] = self._issue(index + 1, self.cycle)
+        self.cycle += 1
+        return list(self.issues)
+
+
+class FakeYouTrack:
+    """In-memory stand-in for the YouTrack endpoints used by the services."""
+
+    def __init__(self):
+        self.issues = {}
+        self.users = {}
+        self.team = set()
+        self.tags = {}
+        self.versions = {}
+
+    def iter_issues(self, query: str, fields: str = None, page_size: int = 500):
+        yield from list(self.issues.values())
+
+    def create_issue(self, payload: dict, fields: str = None) -> dict:
+        yt_id = f"2-{len(self.issues) + 1}"
+        self.issues[yt_id] = {"id": yt_id, "customFields": [], "tags": []}
+        return self.update_issue(yt_id, payload)
+
+    def update_issue(self, issue_id: str, payload: dict, fields: str = None) -> dict:
+        issue = self.issues[issue_id]
+        for key in ("summary", "description"):
+            if key in payload:
+                issue[key] = payload[key]
+        if "tags" in payload:
+            names = {tag_id: name for name, tag_id in self.tags.items()}
+            issue["tags"] = [{"id": tag["id"], "name": names.get(tag["id"])} for tag in payload["tags"]]
+        fields_by_name = {cf["name"]: cf for cf in issue["customFields"]}
+        for field in payload.get("customFields", []):
+            value = field.get("value")
+            if isinstance(value, list):
+                names = {version_id: name for name, version_id in self.versions.items()}
+                value = [{"name": names.get(v["id"])} for v in value]
+            fields_by_name[field["name"]] = {"name": field["name"], "value": value}
+        issue["customFields"] = list(fields_by_name.values())
+        return dict(issue)
+
+    def get_users(self) -> list:
+        return list(self.users.values())
+
+    def create_user(self, login: str, name: str = None) -> dict:
+        self.users[login] = {"login": login, "ringId": f"ring-{login}"}
+        return self.users[login]
+
+    def get_or_create_user(self, login: str, name: str = None) -> dict:
+        return self.users.get(login) or self.create_user(login, name)
+
+    def hub_get(self, path: str, params: dict = None):
+        if path == "/api/admin/projects":
+            return [{"ringId": "project-ring"}]
+        return {"users": [{"id": ring_id} for ring_id in self.team]}
+
+    def hub_post(self, path: str, json: dict = None, params: dict = None) -> dict:
+        self.team.add(json["id"])
+        return {}
+
+    def get_tags(self) -> list:
+        return [{"name": name, "id": tag_id} for name, tag_id in self.tags.items()]
+
+    def create_tag(self, name: str) -> dict:
+        self.tags[name] = f"tag-{len(self.tags)}"
+        return {"id": self.tags[name]}
+
+    def get_project_custom_fields(self, project_id: str) -> list:
+        values = [{"name": name, "id": version_id} for name, version_id in self.versions.items()]
+        return [{"field": {"name": "Fix versions"}, "bundle": {"id": "bundle", "values": values}}]
+
+    def add_version_bundle_value(self, bundle_id: str, name: str) -> dict:
+        self.versions[name] = f"version-{len(self.versions)}"
+        return {"id": self.versions[name]}
+
+
+class SoakTest(unittest.TestCase):
+    """Runs the continuous sync for thousands of cycles and checks that the heap stays flat."""
+
+    def setUp(self):
+        logging.getLogger("gh2yt").setLevel(logging.CRITICAL)
+        self.state_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        logging.getLogger("gh2yt").setLevel(logging.NOTSET)
+        self.state_dir.cleanup()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def test_heap_does_not_grow_over_cycles(self):
+        baseline = {}
+
+        def on_cycle(cycle: int) -> None:
+            if cycle == WARMUP_CYCLES:
+                baseline["bytes"] = tracemalloc.get_traced_memory()[0]
+            elif cycle == CYCLES:
+                baseline["final"] = tracemalloc.get_traced_memory()[0]
+
+        state_store = StateStore(self.state_dir.name)
+        gh = FakeGitHub(CYCLES, on_cycle)
+        yt = FakeYouTrack()
+        orchestrator = ServiceOrchestrator(yt, "P", "0-1", state_store=state_store, cache_max_entries=1000)
+        syncer = IssueSynchronizer(
+            gh,
+            orchestrator,
+            state_store,
+            freshness=FreshnessTracker(slo_seconds=300, window_size=1000),
+            scheduler=TierScheduler(
+                hot_age=3600, warm_age=86400, warm_interval=600, cold_interval=86400, state_store=state_store
+            ),
+        )
+
+        tracemalloc.start()
+        # A short (non-zero) interval keeps the tier schedule active: edited issues are hot,
+        # the rest is covered by the cold sweep
+        syncer.sync("owner/repo", interval=0.001)
+
+        self.assertEqual(gh.cycle, CYCLES)
+        self.assertEqual(len(yt.issues), ISSUES, "issues were created more than once")
+        self.assertEqual(state_store.read("meta")["last_cycle"]["failed"], 0)
+        growth = baseline["final"] - baseline["bytes"]
+        self.assertLess(
+            growth, MAX_GROWTH_BYTES,
+            f"heap grew by {growth} bytes over {CYCLES - WARMUP_CYCLES} cycles"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()